@@ -17,21 +17,29 @@ st.set_page_config(
 import os
 import pandas as pd
 import traceback
-from utils.resume_analyzer import ResumeAnalyzer
+from utils.analysis_cache import get_analysis_cache
+from utils.analysis_jobs import JOB_STAGES, get_analysis_job_queue
+from utils.metrics import METRICS_EXPOSITION_PATH, get_metrics
+from utils.skill_matcher import skill_matcher_cache_info
 from utils.resume_builder import ResumeBuilder
 from config.database import (
-    get_database_connection, save_resume_data, save_analysis_data, 
+    save_resume_data,
     init_database, verify_admin, log_admin_action
 )
 from config.job_roles import JOB_ROLES
-from config.courses import COURSES_BY_CATEGORY, RESUME_VIDEOS, INTERVIEW_VIDEOS, get_courses_for_role, get_category_for_role
+from config.role_index import ROLE_INDEX
+from config.courses import RESUME_VIDEOS, INTERVIEW_VIDEOS, get_courses_for_role
 from dashboard.dashboard import DashboardManager
+from dashboard.exporters import export_resume_data
 import requests
 from streamlit_lottie import st_lottie
 import base64
 import io
 from datetime import datetime
 
+# Seconds between job status polls while an analysis job is in progress
+JOB_POLL_INTERVAL = 1
+
 class ResumeApp:
     def __init__(self):
         """Initialize the application"""
@@ -76,7 +84,13 @@ class ResumeApp:
         # Initialize dashboard manager
         self.dashboard_manager = DashboardManager()
         
-        self.analyzer = ResumeAnalyzer()
+        # App metrics persist across reruns; analyses report their stage timings into them
+        self.metrics = get_metrics()
+        self.analysis_cache = get_analysis_cache()
+        self.metrics.register_collector('caches', self.collect_cache_metrics)
+        self.metrics.start_exposition_writer(METRICS_EXPOSITION_PATH)
+        if st.session_state.is_admin:
+            self.pages["📈 METRICS"] = self.render_metrics
         self.builder = ResumeBuilder()
         self.job_roles = JOB_ROLES
         
@@ -89,6 +103,10 @@ class ResumeApp:
         # Initialize database
         init_database()
         
+        # Uploads are analyzed on a background worker pool (needs the analysis_jobs table)
+        self.analysis_jobs = get_analysis_job_queue()
+        self.analyzer = self.analysis_jobs.analyzer
+        
         # Load external CSS
         with open('ui/global_style.css') as f:
             st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
@@ -107,43 +125,127 @@ class ResumeApp:
         return r.json()
 
 
-    def export_to_excel(self):
+    def export_to_excel(self, filters=None):
         """Export resume data to Excel"""
-        conn = get_database_connection()
-        
-        # Get resume data with analysis
-        query = """
-            SELECT 
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
-        
         try:
-            # Read data into DataFrame
-            df = pd.read_sql_query(query, conn)
-            
-            # Create Excel writer object
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Resume Data')
-            
-            return output.getvalue()
+            # Rows are streamed from the database into the workbook in chunks
+            return export_resume_data('xlsx', filters)
         except Exception as e:
             print(f"Error exporting to Excel: {str(e)}")
             return None
-        finally:
-            conn.close()
 
     def render_dashboard(self):
         """Render the dashboard page"""
         self.dashboard_manager.render_dashboard()
 
+    def render_job_status(self, job_id):
+        """Poll a job from a fragment, so only the status reruns; the page reruns once the job ends"""
+        @st.fragment(run_every=JOB_POLL_INTERVAL)
+        def job_status():
+            job = self.analysis_jobs.get(job_id)
+            if job is None or job['status'] in ('done', 'failed'):
+                st.rerun()
+            self.render_job_progress(job)
+
+        job_status()
+
+    def render_job_progress(self, job):
+        """Show a queued/running analysis job's stage and whatever results it has published"""
+        stage_labels = {
+            'queued': "Waiting for a free analysis worker...",
+            'extracting': "Extracting text...",
+            'document_type': "Analyzing your document...",
+            'scores': "Preparing suggestions...",
+            'suggestions': "Saving results..."
+        }
+        stage = job['stage'] if job['stage'] in stage_labels else 'queued'
+        st.progress(JOB_STAGES.index(stage) / (len(JOB_STAGES) - 1))
+        st.info(stage_labels[stage])
+
+        partial = job['result']
+        if partial.get('document_type'):
+            st.markdown(f"**Document type:** {partial['document_type']}")
+        if 'ats_score' in partial:
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("ATS Score", partial['ats_score'])
+            col2.metric("Keyword Match", f"{int(partial.get('keyword_match', {}).get('score', 0))}%")
+            col3.metric("Format Score", f"{int(partial.get('format_score', 0))}%")
+            col4.metric("Section Score", f"{int(partial.get('section_score', 0))}%")
+
+    def collect_cache_metrics(self):
+        """Cache hit/miss gauges for the metrics registry"""
+        matcher_info = skill_matcher_cache_info()
+        caches = {
+            'dashboard_query': self.dashboard_manager.query_cache.stats(),
+            'analysis': self.analysis_cache.stats(),
+            'skill_matcher': {'hits': matcher_info.hits, 'misses': matcher_info.misses}
+        }
+        gauges = []
+        for cache, stats in caches.items():
+            lookups = stats['hits'] + stats['misses']
+            gauges.append(('cache_hits', {'cache': cache}, stats['hits']))
+            gauges.append(('cache_misses', {'cache': cache}, stats['misses']))
+            gauges.append(('cache_hit_ratio', {'cache': cache}, round(stats['hits'] / lookups, 4) if lookups else 0))
+        return gauges
+
+    def render_metrics(self):
+        """Render the admin metrics page"""
+        if not st.session_state.get('is_admin', False):
+            st.warning("Please log in as admin to view metrics")
+            return
+
+        page_header("App Metrics", "Latency and throughput since this app process started")
+        snapshot = self.metrics.snapshot()
+
+        def format_labels(labels):
+            return ', '.join(f"{name}={value}" for name, value in labels.items()) or '-'
+
+        def counter_sum(name, field='total'):
+            return sum(counter[field] for counter in snapshot['counters'] if counter['name'] == name)
+
+        analysis_latency = next((h for h in snapshot['histograms'] if h['name'] == 'analysis_seconds'), None)
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Uploads Analyzed", counter_sum('uploads_analyzed_total'),
+                    f"{counter_sum('uploads_analyzed_total', 'last_5m')} in last 5 min")
+        col2.metric("Analysis p95",
+                    f"{analysis_latency['p95'] * 1000:.1f} ms" if analysis_latency else "-")
+        col3.metric("Resumes Generated", counter_sum('resumes_generated_total'),
+                    f"{counter_sum('resumes_generated_total', 'last_5m')} in last 5 min")
+        col4.metric("Uptime", f"{snapshot['uptime'] / 3600:.1f} h")
+
+        def ms(value):
+            return round(value * 1000, 2) if value is not None else None
+
+        st.subheader("Latency (recent observations)")
+        st.dataframe(pd.DataFrame([
+            {
+                'Metric': h['name'], 'Labels': format_labels(h['labels']), 'Count': h['count'],
+                'Mean (ms)': ms(h['mean']), 'p50 (ms)': ms(h['p50']), 'p95 (ms)': ms(h['p95']), 'p99 (ms)': ms(h['p99'])
+            }
+            for h in snapshot['histograms']
+        ]), use_container_width=True, hide_index=True)
+
+        st.subheader("Counters")
+        st.dataframe(pd.DataFrame([
+            {
+                'Metric': c['name'], 'Labels': format_labels(c['labels']), 'Total': c['total'],
+                'Last 5 min': c['last_5m'], 'Last hour': c['last_60m']
+            }
+            for c in snapshot['counters']
+        ]), use_container_width=True, hide_index=True)
+
+        st.subheader("Caches")
+        st.dataframe(pd.DataFrame([
+            {'Metric': g['name'], 'Labels': format_labels(g['labels']), 'Value': g['value']}
+            for g in snapshot['gauges']
+        ]), use_container_width=True, hide_index=True)
+
+        exposition = self.metrics.render_prometheus()
+        st.caption(f"Exposition file for scrapers: {os.path.abspath(METRICS_EXPOSITION_PATH)}")
+        with st.expander("Exposition text"):
+            st.code(exposition, language='text')
+        st.download_button("Download Metrics", exposition, file_name="resume_app.prom", mime="text/plain")
+
     def render_empty_state(self, icon, message):
         """Render an empty state with icon and message"""
         return f"""
@@ -441,11 +543,14 @@ class ResumeApp:
                 
                 try:
                     # Generate resume
-                    resume_buffer = self.builder.generate_resume(resume_data)
+                    with self.metrics.time('resume_generation_seconds', template=selected_template):
+                        resume_buffer = self.builder.generate_resume(resume_data)
                     if resume_buffer:
+                        self.metrics.inc('resumes_generated_total', template=selected_template)
                         try:
                             # Save resume data to database
-                            save_resume_data(resume_data)
+                            with self.metrics.time('db_write_seconds', table='resume_data'):
+                                save_resume_data(resume_data)
                             
                             # Offer the resume for download
                             st.success("✅ Resume generated successfully!")
@@ -708,11 +813,8 @@ class ResumeApp:
         )
         
         # Job Role Selection
-        categories = list(self.job_roles.keys())
-        selected_category = st.selectbox("Job Category", categories)
-        
-        roles = list(self.job_roles[selected_category].keys())
-        selected_role = st.selectbox("Choose Role", roles)
+        selected_category = st.selectbox("Job Category", ROLE_INDEX.categories)
+        selected_role = st.selectbox("Choose Role", ROLE_INDEX.roles_by_category[selected_category])
         
         role_info = self.job_roles[selected_category][selected_role]
         
@@ -727,7 +829,7 @@ class ResumeApp:
         """, unsafe_allow_html=True)
         
         # File Upload
-        uploaded_file = st.file_uploader("Upload your resume", type=['pdf', 'docx'])
+        uploaded_file = st.file_uploader("Upload your resume", type=['pdf', 'docx', 'txt', 'rtf', 'odt'])
         
         st.markdown(
             self.render_empty_state(
@@ -738,62 +840,50 @@ class ResumeApp:
         )
         if uploaded_file:
             with st.spinner("Analyzing your document..."):
-                # Get file content
-                text = ""
-                try:
-                    if uploaded_file.type == "application/pdf":
-                        text = self.analyzer.extract_text_from_pdf(uploaded_file)
-                    elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                        text = self.analyzer.extract_text_from_docx(uploaded_file)
+                cache_key = self.analysis_cache.make_key(uploaded_file.getvalue(), selected_category, selected_role)
+                session_jobs = st.session_state.setdefault('analysis_jobs', {})
+                shown = st.session_state.get('shown_analysis')
+                if shown and shown['cache_key'] == cache_key:
+                    # Later reruns for the same upload reuse its result without another lookup
+                    analysis = shown['analysis']
+                elif cache_key in session_jobs:
+                    job = self.analysis_jobs.get(session_jobs[cache_key])
+                    if job is None or job['status'] == 'failed':
+                        # Forget the job so the next rerun retries the upload
+                        session_jobs.pop(cache_key, None)
+                        st.error(f"Error analyzing file: {job['error'] if job else 'the job could not be queued'}")
+                        return
+                    if job['status'] != 'done':
+                        self.render_job_status(session_jobs[cache_key])
+                        return
+                    session_jobs.pop(cache_key)
+                    analysis = job['result']
+                    shown = st.session_state['shown_analysis'] = {
+                        'cache_key': cache_key, 'analysis': analysis, 'saved': job['resume_id'] is not None
+                    }
+                else:
+                    # Reuse the stored analysis when this exact file was already analyzed for this role
+                    cached = self.analysis_cache.get(cache_key)
+                    if cached:
+                        analysis = cached['analysis']
+                        file_type = os.path.splitext(uploaded_file.name)[1].lstrip('.').lower() or 'unknown'
+                        self.metrics.inc('uploads_analyzed_total', file_type=file_type, cache='hit')
+                        shown = st.session_state['shown_analysis'] = {
+                            'cache_key': cache_key, 'analysis': analysis, 'saved': None
+                        }
                     else:
-                        text = uploaded_file.getvalue().decode()
-                except Exception as e:
-                    st.error(f"Error reading file: {str(e)}")
-                    return
+                        # Extraction, analysis and saving run on the job queue
+                        session_jobs[cache_key] = self.analysis_jobs.submit(
+                            uploaded_file.getvalue(), uploaded_file.name, uploaded_file.type,
+                            selected_category, selected_role, role_info, cache_key
+                        )
+                        self.render_job_status(session_jobs[cache_key])
+                        return
 
-                
-                # Analyze the document
-                analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
-                
-                # Save resume data to database
-                resume_data = {
-                    'personal_info': {
-                        'name': analysis.get('name', ''),
-                        'email': analysis.get('email', ''),
-                        'phone': analysis.get('phone', ''),
-                        'linkedin': analysis.get('linkedin', ''),
-                        'github': analysis.get('github', ''),
-                        'portfolio': analysis.get('portfolio', '')
-                    },
-                    'summary': analysis.get('summary', ''),
-                    'target_role': selected_role,
-                    'target_category': selected_category,
-                    'education': analysis.get('education', []),
-                    'experience': analysis.get('experience', []),
-                    'projects': analysis.get('projects', []),
-                    'skills': analysis.get('skills', []),
-                    'template': ''
-                }
-                
-                # Save to database
-                try:
-                    resume_id = save_resume_data(resume_data)
-                    
-                    # Save analysis data
-                    analysis_data = {
-                        'resume_id': resume_id,
-                        'ats_score': analysis['ats_score'],
-                        'keyword_match_score': analysis['keyword_match']['score'],
-                        'format_score': analysis['format_score'],
-                        'section_score': analysis['section_score'],
-                        'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
-                        'recommendations': ','.join(analysis['suggestions'])
-                    }
-                    save_analysis_data(resume_id, analysis_data)
+                if shown['saved'] is True:
                     st.success("Resume data saved successfully!")
-                except Exception as e:
-                    st.error(f"Error saving to database: {str(e)}")
-                    print(f"Database error: {e}")
+                elif shown['saved'] is False:
+                    st.warning("⚠️ Resume analyzed but couldn't be saved to database")
                 
                 # Show results based on document type
                 if analysis.get('document_type') != 'resume':
@@ -962,8 +1052,24 @@ class ResumeApp:
                     
                     st.markdown("</div>", unsafe_allow_html=True)
                 
+                # Other roles this resume fits, ranked across the whole role catalog
+                role_matches = analysis.get('role_matches', [])
+                if role_matches:
+                    st.markdown("""
+                    <div class="feature-card">
+                        <h2>🧭 Best Matching Roles</h2>
+                    """, unsafe_allow_html=True)
+                    for match in role_matches:
+                        missing = ', '.join(match['missing_skills'][:5]) or 'None'
+                        st.markdown(f"""
+                        <div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px; margin: 10px 0;'>
+                            <h4>{match['role']} <span style='color: #B0B0B0; font-size: 0.9em;'>({match['category']})</span></h4>
+                            <p>Skill match: <strong style='color: #4CAF50;'>{match['score']:.0f}%</strong></p>
+                            <p style='color: #B0B0B0;'>Skills to add: {missing}</p>
+                        </div>
+                        """, unsafe_allow_html=True)
+                    st.markdown("</div>", unsafe_allow_html=True)
 
-                
                 # Course Recommendations
                 st.markdown("""
                 <div class="feature-card">
@@ -971,10 +1077,7 @@ class ResumeApp:
                 """, unsafe_allow_html=True)
                 
                 # Get courses based on role and category
-                courses = get_courses_for_role(selected_role)
-                if not courses:
-                    category = get_category_for_role(selected_role)
-                    courses = COURSES_BY_CATEGORY.get(category, {}).get(selected_role, [])
+                courses = get_courses_for_role(selected_role) or ()
                 
                 # Display courses in a grid
                 cols = st.columns(2)
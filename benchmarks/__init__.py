@@ -0,0 +1,5 @@
+"""
+Benchmarks for Smart Resume AI
+
+Run from the repository root, e.g. ``python -m benchmarks.bench_docx_extraction``.
+"""
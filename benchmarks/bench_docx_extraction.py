@@ -0,0 +1,65 @@
+"""
+Compare the streaming DOCX extractor against the python-docx object model
+
+    python -m benchmarks.bench_docx_extraction --count 400
+"""
+import argparse
+import statistics
+import time
+
+from benchmarks.corpus import generate_docx_corpus
+from utils.text_extraction import extract_docx_text, extract_docx_text_python_docx
+
+BACKENDS = {
+    'python-docx': extract_docx_text_python_docx,
+    'document.xml iterparse': extract_docx_text,
+}
+
+
+def time_backend(extractor, documents, repeat):
+    """Return per-document timings in milliseconds (best of ``repeat`` runs)"""
+    timings = []
+    for data in documents:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            extractor(data)
+            elapsed = (time.perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        timings.append(best)
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark DOCX text extraction backends")
+    parser.add_argument('--count', type=int, default=200, help="Number of generated resumes")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per document (best is kept)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    documents = [docx_bytes for _, docx_bytes in generate_docx_corpus(args.count, seed=args.seed)]
+    print(f"Corpus: {len(documents)} resumes across all ResumeBuilder templates")
+
+    results = {}
+    for name, extractor in BACKENDS.items():
+        timings = time_backend(extractor, documents, args.repeat)
+        results[name] = timings
+        print(
+            f"{name:>24}: mean {statistics.mean(timings):.3f} ms  "
+            f"median {statistics.median(timings):.3f} ms  "
+            f"total {sum(timings):.1f} ms"
+        )
+
+    baseline, fast = (sum(results[name]) for name in BACKENDS)
+    print(f"Speedup: {baseline / fast:.1f}x")
+
+    # Every body paragraph python-docx sees must also come out of the fast path
+    missing = 0
+    for data in documents:
+        fast_lines = set(extract_docx_text(data).split('\n'))
+        missing += sum(1 for line in extract_docx_text_python_docx(data).split('\n') if line not in fast_lines)
+    print(f"Paragraphs missing from the fast path: {missing}")
+
+
+if __name__ == "__main__":
+    main()
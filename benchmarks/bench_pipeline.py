@@ -0,0 +1,192 @@
+"""
+Time every stage of the analyzer pipeline over a synthetic DOCX/PDF corpus
+
+    python -m benchmarks.bench_pipeline --count 1000 --baseline-out benchmarks/baseline.json
+    python -m benchmarks.bench_pipeline --count 1000 --compare benchmarks/baseline.json
+
+Stages are timed one resume at a time, in the order the app runs them.
+extract_text is reported per input format; every other stage runs on the
+extracted text of both variants. DB writes go to a temporary database.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from benchmarks.corpus import generate_corpus
+from config import database
+from config.role_index import ROLE_INDEX
+from utils.resume_analyzer import ResumeAnalyzer
+from utils.section_segmenter import segment_sections
+
+SECTION_STAGES = [
+    'extract_personal_info', 'extract_education', 'extract_experience',
+    'extract_projects', 'extract_skills', 'extract_summary'
+]
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(timings):
+    """Per-stage p50/p95/p99, mean (ms) and throughput (items/s)"""
+    summary = {}
+    for stage, values in timings.items():
+        values = sorted(values)
+        total = sum(values)
+        summary[stage] = {
+            'count': len(values),
+            **{f'p{pct}': round(percentile(values, pct), 4) for pct in PERCENTILES},
+            'mean': round(total / len(values), 4),
+            'throughput': round(len(values) / (total / 1000), 1) if total else 0.0,
+        }
+    return summary
+
+
+def run_pipeline(analyzer, data, file_format, file_bytes, record):
+    """Run one resume through every stage, recording each stage's time in ms"""
+    def timed(stage, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = (time.perf_counter() - start) * 1000
+        record(stage, elapsed)
+        return result, elapsed
+
+    text, extract_ms = timed(f'extract_text[{file_format}]', analyzer.extract_text, file_bytes, f'resume.{file_format}')
+    timed('detect_document_type', analyzer.detect_document_type, text)
+    _, role_info = ROLE_INDEX.get_role_info(data['target_role'], data['target_category'])
+    required_skills = role_info['required_skills']
+    timed('calculate_keyword_match', analyzer.calculate_keyword_match, text, required_skills)
+
+    # The extract_* methods share one cached segmentation; time it on its own
+    segment_sections.cache_clear()
+    timed('segment_sections', analyzer.get_sections, text)
+    for stage in SECTION_STAGES:
+        timed(stage, getattr(analyzer, stage), text)
+    timed('check_formatting', analyzer.check_formatting, text)
+
+    segment_sections.cache_clear()
+    analysis, analyze_ms = timed('analyze_resume', analyzer.analyze_resume,
+                                 {'raw_text': text}, {'required_skills': required_skills})
+
+    resume_id, save_resume_ms = timed('save_resume_data', database.save_resume_data, data)
+    _, save_analysis_ms = timed('save_analysis_data', database.save_analysis_data, resume_id, {
+        'ats_score': analysis['ats_score'],
+        'keyword_match_score': analysis['keyword_match']['score'],
+        'format_score': analysis['format_score'],
+        'section_score': analysis['section_score'],
+        'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
+        'recommendations': ','.join(analysis['suggestions'])
+    })
+
+    # What one upload costs end to end in the app
+    record('pipeline', extract_ms + analyze_ms + save_resume_ms + save_analysis_ms)
+
+
+def compare(summary, baseline, threshold, min_delta):
+    """Return (stage, metric, baseline, current) for every metric slower than the baseline allows"""
+    regressions = []
+    for stage, stats in summary.items():
+        previous = baseline.get('stages', {}).get(stage)
+        if not previous:
+            continue
+        for metric in ('p50', 'p95'):
+            before, after = previous[metric], stats[metric]
+            if after > before * (1 + threshold) and after - before > min_delta:
+                regressions.append((stage, metric, before, after))
+    return regressions
+
+
+def print_summary(summary, baseline=None):
+    header = f"{'stage':>26} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'items/s':>10}"
+    if baseline:
+        header += f" {'p50 vs base':>12}"
+    print(header)
+    for stage, stats in summary.items():
+        line = (
+            f"{stage:>26} {stats['p50']:>9.3f} {stats['p95']:>9.3f} "
+            f"{stats['p99']:>9.3f} {stats['throughput']:>10.1f}"
+        )
+        previous = (baseline or {}).get('stages', {}).get(stage)
+        if previous and previous['p50']:
+            line += f" {(stats['p50'] / previous['p50'] - 1) * 100:>+11.1f}%"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the resume analyzer pipeline stage by stage")
+    parser.add_argument('--count', type=int, default=200, help="Number of generated resumes (per format)")
+    parser.add_argument('--formats', default='docx,pdf', help="Comma-separated input formats")
+    parser.add_argument('--warmup', type=int, default=5, help="Resumes run before timing starts")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--baseline-out', help="Write the results to this JSON file")
+    parser.add_argument('--compare', help="Baseline JSON to compare against; exits 1 on regression")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Allowed slowdown before a regression (0.2 = 20%%)")
+    parser.add_argument('--min-delta', type=float, default=0.05, help="Ignore slowdowns smaller than this many ms")
+    args = parser.parse_args(argv)
+
+    formats = tuple(fmt.strip() for fmt in args.formats.split(',') if fmt.strip())
+    analyzer = ResumeAnalyzer()
+    # Extraction first and the end-to-end figure last in the report
+    timings = {f'extract_text[{fmt}]': [] for fmt in formats}
+
+    def record(stage, elapsed):
+        timings.setdefault(stage, []).append(elapsed)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database.use_database(os.path.join(tmp_dir, 'bench.db'))
+        database.init_database()
+
+        # Documents are generated lazily, outside the timed stages
+        warmup = args.warmup * len(formats)
+        corpus = generate_corpus(args.count + args.warmup, seed=args.seed, formats=formats)
+        for index, (data, file_format, file_bytes) in enumerate(corpus):
+            run_pipeline(analyzer, data, file_format, file_bytes, record if index >= warmup else lambda *_: None)
+
+        database.use_database(database.DATABASE_PATH)
+
+    timings['pipeline'] = timings.pop('pipeline')
+    print(f"Corpus: {args.count * len(formats)} documents ({', '.join(formats)}) across all ResumeBuilder templates")
+    summary = summarize(timings)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_summary(summary, baseline)
+
+    if args.baseline_out:
+        with open(args.baseline_out, 'w', encoding='utf-8') as f:
+            json.dump({
+                'created_at': datetime.now().isoformat(timespec='seconds'),
+                'python': sys.version.split()[0],
+                'platform': platform.platform(),
+                'count': args.count,
+                'formats': list(formats),
+                'seed': args.seed,
+                'stages': summary,
+            }, f, indent=2)
+        print(f"Baseline written to {args.baseline_out}")
+
+    if baseline:
+        regressions = compare(summary, baseline, args.threshold, args.min_delta)
+        for stage, metric, before, after in regressions:
+            print(f"REGRESSION {stage} {metric}: {before:.3f} ms -> {after:.3f} ms")
+        if regressions:
+            return 1
+        print("No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Compare the compiled regex bank against the per-call pattern strings it replaced
+
+    python -m benchmarks.bench_regex --count 400
+"""
+import argparse
+import re
+import statistics
+import time
+
+from benchmarks.corpus import generate_docx_corpus
+from utils.patterns import (
+    CONTACT_PATTERNS, CONTACT_WORD_PATTERN, EDUCATION_CHECKS, EXPERIENCE_CHECKS, FORMATTED_CONTACT_PATTERN,
+    find_contacts, passing_checks
+)
+from utils.resume_analyzer import ResumeAnalyzer
+from utils.text_extraction import extract_docx_text
+
+
+def legacy_heuristics(text, experience, education):
+    """The regex work of extract_personal_info, check_formatting and analyze_resume before the pattern bank"""
+    email = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+    phone = re.search(r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}', text)
+    linkedin = re.search(r'linkedin\.com/in/[\w-]+', text)
+    github = re.search(r'github\.com/[\w-]+', text)
+    contacts = tuple(match.group(0) if match else '' for match in (email, phone, linkedin, github))
+
+    contact_patterns = [
+        r'\b[\w\.-]+@[\w\.-]+\.\w+\b',
+        r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
+        r'linkedin\.com/\w+',
+    ]
+    formatted_contact = any(re.search(pattern, text) for pattern in contact_patterns)
+    contact_words = bool(re.search(r'\b(?:email|phone|address|tel|mobile|linkedin)\b', text.lower()))
+
+    experience_checks = (
+        any(re.search(r'\b(19|20)\d{2}\b', exp) for exp in experience),
+        any(re.search(r'[•\-\*]', exp) for exp in experience),
+        any(re.search(r'\b(developed|managed|created|implemented|designed|led|improved)\b', exp.lower())
+            for exp in experience),
+    )
+    education_checks = (
+        any(re.search(r'\b(19|20)\d{2}\b', edu) for edu in education),
+        any(re.search(r'\b(bachelor|master|phd|b\.|m\.|diploma)\b', edu.lower()) for edu in education),
+        any(re.search(r'\b(gpa|cgpa|grade|percentage)\b', edu.lower()) for edu in education),
+    )
+    return contacts, formatted_contact, contact_words, experience_checks, education_checks
+
+
+def compiled_heuristics(text, experience, education):
+    """The same checks through utils.patterns"""
+    contacts = find_contacts(text)
+    experience_found = passing_checks(EXPERIENCE_CHECKS, experience)
+    education_found = passing_checks(EDUCATION_CHECKS, education)
+    return (
+        tuple(contacts[field] for field in ('email', 'phone', 'linkedin', 'github')),
+        bool(FORMATTED_CONTACT_PATTERN.search(text)),
+        bool(CONTACT_WORD_PATTERN.search(text)),
+        tuple(name in experience_found for name in ('date', 'bullet', 'action_verb')),
+        tuple(name in education_found for name in ('date', 'degree', 'gpa')),
+    )
+
+
+# The alternative that was measured and rejected: one alternation with a named group per field
+COMBINED_CONTACT_PATTERN = re.compile('|'.join(
+    f'(?P<{field}>{pattern.pattern})' for field, pattern in CONTACT_PATTERNS.items()
+))
+
+
+def combined_scan_heuristics(text, experience, education):
+    """The pattern bank, but with contacts found by a single named-group scan"""
+    found = {}
+    for match in COMBINED_CONTACT_PATTERN.finditer(text):
+        found.setdefault(match.lastgroup, match.group(0))
+        if len(found) == len(CONTACT_PATTERNS):
+            break
+    passing_checks(EXPERIENCE_CHECKS, experience)
+    passing_checks(EDUCATION_CHECKS, education)
+    return found
+
+
+IMPLEMENTATIONS = {
+    're.search per pattern': legacy_heuristics,
+    'compiled pattern bank': compiled_heuristics,
+    'single named-group scan': combined_scan_heuristics,
+}
+
+
+def time_implementation(heuristics, samples, repeat):
+    """Return per-resume timings in microseconds (best of ``repeat`` runs)"""
+    timings = []
+    for sample in samples:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            heuristics(*sample)
+            elapsed = (time.perf_counter() - start) * 1e6
+            best = elapsed if best is None else min(best, elapsed)
+        timings.append(best)
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the resume regex heuristics")
+    parser.add_argument('--count', type=int, default=200, help="Number of generated resumes")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per resume (best is kept)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    analyzer = ResumeAnalyzer()
+    samples = []
+    for _, docx_bytes in generate_docx_corpus(args.count, seed=args.seed):
+        text = extract_docx_text(docx_bytes)
+        samples.append((text, analyzer.extract_experience(text), analyzer.extract_education(text)))
+    print(f"Corpus: {len(samples)} resumes across all ResumeBuilder templates")
+
+    results = {}
+    for name, heuristics in IMPLEMENTATIONS.items():
+        timings = time_implementation(heuristics, samples, args.repeat)
+        results[name] = timings
+        print(
+            f"{name:>24}: mean {statistics.mean(timings):.1f} us  "
+            f"median {statistics.median(timings):.1f} us  "
+            f"total {sum(timings) / 1000:.1f} ms"
+        )
+
+    baseline = sum(results['re.search per pattern'])
+    for name in list(IMPLEMENTATIONS)[1:]:
+        print(f"Speedup of {name}: {baseline / sum(results[name]):.2f}x")
+
+    differing = sum(1 for sample in samples if legacy_heuristics(*sample) != compiled_heuristics(*sample))
+    print(f"Resumes with different results: {differing}")
+
+
+if __name__ == "__main__":
+    main()
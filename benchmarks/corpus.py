@@ -0,0 +1,177 @@
+"""
+Synthetic resume corpus built with ResumeBuilder templates
+"""
+import contextlib
+import io
+import os
+import random
+
+from config.job_roles import JOB_ROLES
+from utils.resume_builder import ResumeBuilder
+
+TEMPLATES = ["Modern", "Professional", "Minimal", "Creative"]
+
+FIRST_NAMES = ['Aarav', 'Maya', 'Liam', 'Priya', 'Noah', 'Sofia', 'Arjun', 'Emma', 'Kenji', 'Zara']
+LAST_NAMES = ['Sharma', 'Johnson', 'Chen', 'Garcia', 'Patel', 'Okafor', 'Smith', 'Nguyen', 'Kumar', 'Rossi']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries', 'Wayne Tech', 'Hooli']
+SCHOOLS = ['State University', 'Institute of Technology', 'City College', 'National University']
+DEGREES = ['B.Tech', 'Bachelor of Science', 'Master of Science', 'MCA', 'MBA']
+FIELDS = ['Computer Science', 'Information Technology', 'Data Science', 'Electronics', 'Design']
+VERBS = ['Developed', 'Designed', 'Implemented', 'Led', 'Improved', 'Managed', 'Created']
+OBJECTS = ['a REST API', 'the data pipeline', 'a dashboard', 'CI/CD workflows', 'the mobile app', 'test automation']
+SOFT_SKILLS = ['Communication', 'Leadership', 'Teamwork', 'Problem-solving', 'Time management']
+LANGUAGES = ['English', 'Hindi', 'Spanish', 'French', 'German']
+
+ALL_ROLES = [
+    (category, role, info)
+    for category, roles in JOB_ROLES.items()
+    for role, info in roles.items()
+]
+
+
+def _sentence(rng):
+    return f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(['Python', 'Java', 'React', 'SQL', 'AWS', 'Docker'])}"
+
+
+def random_resume_data(rng, template=None):
+    """Build randomized ResumeBuilder input for one resume"""
+    category, role, info = rng.choice(ALL_ROLES)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    handle = name.lower().replace(' ', '')
+    skills = info['required_skills']
+
+    return {
+        'template': template or rng.choice(TEMPLATES),
+        'target_role': role,
+        'target_category': category,
+        'personal_info': {
+            'full_name': name,
+            'email': f"{handle}@example.com",
+            'phone': f"{rng.randint(200, 999)}-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+            'location': rng.choice(['Bengaluru', 'Austin', 'Berlin', 'Toronto', 'Remote']),
+            'linkedin': f"linkedin.com/in/{handle}",
+            'portfolio': f"https://{handle}.dev",
+            'title': role
+        },
+        'summary': f"{role} with {rng.randint(1, 12)} years of experience. " + '. '.join(_sentence(rng) for _ in range(3)) + '.',
+        'experience': [
+            {
+                'position': role,
+                'company': rng.choice(COMPANIES),
+                'start_date': f"{year}",
+                'end_date': f"{year + rng.randint(1, 3)}",
+                'description': _sentence(rng),
+                'responsibilities': [_sentence(rng) for _ in range(rng.randint(2, 5))],
+                'achievements': [_sentence(rng) for _ in range(rng.randint(0, 2))]
+            }
+            for year in sorted(rng.sample(range(2008, 2022), rng.randint(1, 4)))
+        ],
+        'projects': [
+            {
+                'name': f"Project {rng.choice(['Atlas', 'Nova', 'Orion', 'Pulse', 'Quill'])}",
+                'technologies': ', '.join(rng.sample(skills, min(3, len(skills)))),
+                'description': _sentence(rng),
+                'responsibilities': [_sentence(rng) for _ in range(rng.randint(1, 3))],
+                'achievements': [],
+                'link': f"https://github.com/{handle}/project"
+            }
+            for _ in range(rng.randint(1, 3))
+        ],
+        'education': [
+            {
+                'school': rng.choice(SCHOOLS),
+                'degree': rng.choice(DEGREES),
+                'field': rng.choice(FIELDS),
+                'graduation_date': str(rng.randint(2005, 2023)),
+                'gpa': f"{rng.uniform(2.8, 4.0):.2f}",
+                'achievements': []
+            }
+        ],
+        'skills': {
+            'technical': rng.sample(skills, rng.randint(1, len(skills))),
+            'soft': rng.sample(SOFT_SKILLS, 3),
+            'languages': rng.sample(LANGUAGES, 2),
+            'tools': ['Git', 'Jira']
+        }
+    }
+
+
+def generate_docx_corpus(count, seed=0):
+    """Yield (resume_data, docx_bytes) pairs, cycling through all templates"""
+    rng = random.Random(seed)
+    builder = ResumeBuilder()
+    for index in range(count):
+        data = random_resume_data(rng, template=TEMPLATES[index % len(TEMPLATES)])
+        # ResumeBuilder logs every step to stdout
+        with contextlib.redirect_stdout(io.StringIO()):
+            buffer = builder.generate_resume(data)
+        yield data, buffer.getvalue()
+
+
+def _pdf_escape(line):
+    """Escape a line for a PDF string literal, replacing characters Helvetica cannot encode"""
+    line = line.encode('latin-1', errors='replace').decode('latin-1')
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_text_pdf(lines, lines_per_page=50):
+    """Lay text lines out as a minimal multi-page PDF (Helvetica, no dependencies)"""
+    pages = [lines[start:start + lines_per_page] for start in range(0, len(lines), lines_per_page)] or [[]]
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    font_id = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    # Each page adds a content stream and a page object; the page tree comes next
+    pages_id = len(objects) + 2 * len(pages) + 1
+    page_ids = []
+    for page_lines in pages:
+        content = "BT /F1 10 Tf 50 780 Td 14 TL " + " ".join(f"({_pdf_escape(line)}) '" for line in page_lines) + " ET"
+        content = content.encode('latin-1')
+        content_id = add(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+        page_ids.append(add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 %d 0 R >> >> >>" % (pages_id, content_id, font_id)
+        ))
+    add(b"<< /Type /Pages /Kids [" + b" ".join(b"%d 0 R" % page_id for page_id in page_ids) + b"] /Count %d >>" % len(page_ids))
+    catalog_id = add(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, catalog_id, xref_offset)
+    return bytes(out)
+
+
+def generate_corpus(count, seed=0, formats=('docx', 'pdf')):
+    """Yield (resume_data, format, file_bytes) for each resume in each requested format
+
+    PDF variants carry the same text as the DOCX, laid out by write_text_pdf.
+    """
+    from utils.text_extraction import extract_docx_text
+
+    for data, docx_bytes in generate_docx_corpus(count, seed=seed):
+        if 'docx' in formats:
+            yield data, 'docx', docx_bytes
+        if 'pdf' in formats:
+            lines = [line for line in extract_docx_text(docx_bytes).split('\n') if line.strip()]
+            yield data, 'pdf', write_text_pdf(lines)
+
+
+def write_docx_corpus(directory, count, seed=0):
+    """Write a generated corpus to disk and return the file paths"""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for index, (data, docx_bytes) in enumerate(generate_docx_corpus(count, seed=seed)):
+        path = os.path.join(directory, f"resume_{index:05d}_{data['template'].lower()}.docx")
+        with open(path, 'wb') as f:
+            f.write(docx_bytes)
+        paths.append(path)
+    return paths
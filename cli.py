@@ -0,0 +1,128 @@
+"""
+Headless bulk screening for Smart Resume Analyzer
+
+Screens a directory (or glob) of resumes (PDF, DOCX, TXT, RTF, ODT) against a job role without
+starting Streamlit, writing one JSONL or CSV row per resume.
+
+    python cli.py resumes/ --role "Backend Developer" --workers 8 -o results.jsonl
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+
+from config.role_index import ROLE_INDEX
+from utils.resume_analyzer import ResumeAnalyzer
+
+RESUME_EXTENSIONS = ('.pdf', '.docx', '.txt', '.rtf', '.odt')
+SECTION_NAMES = ['contact', 'summary', 'skills', 'experience', 'education', 'format']
+
+
+def collect_resume_paths(inputs):
+    """Expand directories and glob patterns into a sorted list of resume files"""
+    paths = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _, files in os.walk(item):
+                paths.update(
+                    os.path.join(root, name) for name in files
+                    if name.lower().endswith(RESUME_EXTENSIONS)
+                )
+        else:
+            paths.update(path for path in glob.glob(item, recursive=True) if os.path.isfile(path))
+    return sorted(paths)
+
+
+def find_role(role, category=None):
+    """Look up a role in JOB_ROLES, returning (category, role_info) or (None, None)"""
+    return ROLE_INDEX.get_role_info(role, category)
+
+
+def build_row(path, analysis):
+    """Flatten an analysis into the fields written per resume"""
+    section_scores = analysis.get('section_scores', {})
+    return {
+        'file': path,
+        'document_type': analysis.get('document_type', ''),
+        'ats_score': analysis.get('ats_score', 0),
+        'keyword_match_score': analysis.get('keyword_match', {}).get('score', 0),
+        'format_score': analysis.get('format_score', 0),
+        'section_score': analysis.get('section_score', 0),
+        'section_scores': {name: section_scores.get(name) for name in SECTION_NAMES},
+        'missing_skills': analysis.get('keyword_match', {}).get('missing_skills', []),
+        'error': analysis.get('error', '')
+    }
+
+
+class JsonlWriter:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, row):
+        self.stream.write(json.dumps(row) + '\n')
+
+
+class CsvWriter:
+    fieldnames = [
+        'file', 'document_type', 'ats_score', 'keyword_match_score', 'format_score',
+        'section_score', *[f'section_{name}' for name in SECTION_NAMES], 'missing_skills', 'error'
+    ]
+
+    def __init__(self, stream):
+        self.writer = csv.DictWriter(stream, fieldnames=self.fieldnames)
+        self.writer.writeheader()
+
+    def write(self, row):
+        row = dict(row)
+        for name, score in row.pop('section_scores').items():
+            row[f'section_{name}'] = score
+        row['missing_skills'] = ';'.join(row['missing_skills'])
+        self.writer.writerow(row)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Screen a folder of resumes against a job role")
+    parser.add_argument('inputs', nargs='+', help="Resume directories, files or glob patterns")
+    parser.add_argument('--role', required=True, help="Target role, e.g. 'Backend Developer'")
+    parser.add_argument('--category', help="Job category (looked up from the role when omitted)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument('--format', choices=['jsonl', 'csv'], help="Output format (default: from --output, else jsonl)")
+    parser.add_argument('-o', '--output', help="Output file (default: stdout)")
+    parser.add_argument('--ordered', action='store_true', help="Write rows in input order")
+    return parser, parser.parse_args(argv)
+
+
+def main(argv=None):
+    parser, args = parse_args(argv)
+
+    category, role_info = find_role(args.role, args.category)
+    if not role_info:
+        parser.error(f"Unknown role '{args.role}'" + (f" in category '{args.category}'" if args.category else ''))
+
+    paths = collect_resume_paths(args.inputs)
+    if not paths:
+        parser.error("No resumes found")
+
+    output_format = args.format or ('csv' if args.output and args.output.lower().endswith('.csv') else 'jsonl')
+    stream = open(args.output, 'w', newline='', encoding='utf-8') if args.output else sys.stdout
+
+    try:
+        writer = CsvWriter(stream) if output_format == 'csv' else JsonlWriter(stream)
+        analyzer = ResumeAnalyzer()
+        failed = 0
+        for index, analysis in analyzer.analyze_batch(paths, role_info, workers=args.workers, ordered=args.ordered):
+            row = build_row(paths[index], analysis)
+            failed += bool(row['error'])
+            writer.write(row)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+    print(f"Screened {len(paths)} resumes against {category} / {args.role} ({failed} failed)", file=sys.stderr)
+    return 1 if failed == len(paths) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
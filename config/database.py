@@ -1,10 +1,159 @@
+import ast
+import json
+import re
 import sqlite3
+import threading
 from datetime import datetime
 
+DATABASE_PATH = 'resume_data.db'
+
+# Bumped after every committed write; readers compare it to drop stale cached results
+_data_version = 0
+_data_version_lock = threading.Lock()
+
+# Applied to every new connection
+CONNECTION_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',       # readers no longer block the writer
+    'PRAGMA synchronous=NORMAL',     # safe with WAL, far fewer fsyncs
+    'PRAGMA cache_size=-16000',      # 16 MB page cache per connection
+    'PRAGMA mmap_size=268435456',    # memory-map up to 256 MB of the file
+    'PRAGMA temp_store=MEMORY',
+)
+
+
+class PooledConnection(sqlite3.Connection):
+    """SQLite connection whose close() hands it back to its pool"""
+    pool = None
+
+    def close(self):
+        if self.pool is None:
+            super().close()
+        else:
+            self.pool.release(self)
+
+    def close_connection(self):
+        """Really close the underlying connection"""
+        super().close()
+
+
+class ConnectionPool:
+    """Thread-aware pool of SQLite connections
+
+    Each thread is handed one connection at a time; nested checkouts on the
+    same thread share it. A connection goes back to the idle list once every
+    checkout on its thread has been closed, or when its thread has exited.
+    Connections are kept open, so their compiled statement caches are reused.
+    """
+
+    def __init__(self, path, max_idle=8, timeout=30, cached_statements=256):
+        self.path = path
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._idle = []
+        self._in_use = {}  # thread -> connection
+
+    def _connect(self):
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+            factory=PooledConnection
+        )
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        conn.pool = self
+        return conn
+
+    def get(self):
+        """Check out the current thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            self._local.depth += 1
+            return conn
+
+        with self._lock:
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                conn = self._reclaim_from_dead_threads()
+            thread = threading.current_thread()
+            if conn is None:
+                conn = self._connect()
+            self._in_use[thread] = conn
+
+        self._local.conn = conn
+        self._local.depth = 1
+        return conn
+
+    def _reclaim_from_dead_threads(self):
+        for thread, conn in list(self._in_use.items()):
+            if not thread.is_alive():
+                del self._in_use[thread]
+                if conn.in_transaction:
+                    conn.rollback()
+                return conn
+        return None
+
+    def release(self, conn):
+        """Return a checkout; the connection is pooled once the thread is done with it"""
+        if getattr(self._local, 'conn', None) is not conn:
+            # Closed from a thread that did not check it out; drop it
+            with self._lock:
+                for thread, in_use in list(self._in_use.items()):
+                    if in_use is conn:
+                        del self._in_use[thread]
+            conn.close_connection()
+            return
+
+        self._local.depth -= 1
+        if self._local.depth > 0:
+            return
+
+        self._local.conn = None
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            self._in_use.pop(threading.current_thread(), None)
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close_connection()
+
+    def close_all(self):
+        """Close every idle connection (connections in use close when released)"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close_connection()
+
+
+_pool = ConnectionPool(DATABASE_PATH)
+
+
 def get_database_connection():
-    """Create and return a database connection"""
-    conn = sqlite3.connect('resume_data.db')
-    return conn
+    """Get a pooled database connection; close() returns it to the pool"""
+    return _pool.get()
+
+
+def use_database(path):
+    """Point the connection pool at another database file (benchmarks, scripts)"""
+    global _pool
+    previous, _pool = _pool, ConnectionPool(path)
+    previous.close_all()
+
+def get_data_version():
+    """Get the in-process counter of committed resume/analysis writes"""
+    return _data_version
+
+def bump_data_version():
+    """Mark cached query results built from older data as stale"""
+    global _data_version
+    with _data_version_lock:
+        _data_version += 1
 
 def init_database():
     """Initialize database tables"""
@@ -62,6 +211,17 @@ def init_database():
     )
     ''')
     
+    # Create analysis_cache table
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS analysis_cache (
+        cache_key TEXT PRIMARY KEY,
+        resume_id INTEGER,
+        analysis TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (resume_id) REFERENCES resume_data (id)
+    )
+    ''')
+    
     # Create admin_logs table
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS admin_logs (
@@ -83,7 +243,247 @@ def init_database():
     ''')
     
     conn.commit()
-    conn.close()
+    
+    try:
+        run_migrations(conn)
+    finally:
+        conn.close()
+
+# Schema migrations, applied in order and recorded in schema_version.
+# Each step is a SQL statement or a callable taking a cursor.
+MIGRATIONS = [
+    (1, 'Index dashboard filter, join and sort columns', [
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_created_at ON resume_data (created_at)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_target_category ON resume_data (target_category)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_data_target_role ON resume_data (target_role)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_analysis_resume_id ON resume_analysis (resume_id)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_analysis_ats_score ON resume_analysis (ats_score)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_analysis_created_at ON resume_analysis (created_at)',
+    ]),
+    (2, 'Normalize resume skills into skills / resume_skills', [
+        '''
+        CREATE TABLE IF NOT EXISTS skills (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL UNIQUE,
+            display_name TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        'ALTER TABLE resume_skills ADD COLUMN skill_id INTEGER REFERENCES skills (id)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_skills_skill_id ON resume_skills (skill_id)',
+        'CREATE INDEX IF NOT EXISTS idx_resume_skills_resume_id ON resume_skills (resume_id)',
+        lambda cursor: backfill_resume_skills(cursor),
+    ]),
+    (3, 'Daily dashboard rollups per category and role', [
+        '''
+        CREATE TABLE IF NOT EXISTS dashboard_daily_rollup (
+            day TEXT NOT NULL,
+            target_category TEXT NOT NULL,
+            target_role TEXT NOT NULL,
+            submissions INTEGER NOT NULL DEFAULT 0,
+            analyses INTEGER NOT NULL DEFAULT 0,
+            ats_sum REAL NOT NULL DEFAULT 0,
+            keyword_sum REAL NOT NULL DEFAULT 0,
+            high_scoring INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (day, target_category, target_role)
+        )
+        ''',
+        lambda cursor: rebuild_rollups(cursor),
+    ]),
+    (4, 'Persisted state of queued resume analysis jobs', [
+        '''
+        CREATE TABLE IF NOT EXISTS analysis_jobs (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL DEFAULT 'queued',
+            stage TEXT NOT NULL DEFAULT 'queued',
+            filename TEXT,
+            target_category TEXT,
+            target_role TEXT,
+            cache_key TEXT,
+            result TEXT,
+            error TEXT,
+            resume_id INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_analysis_jobs_status ON analysis_jobs (status)',
+    ]),
+    (5, 'Record which app process owns each analysis job', [
+        'ALTER TABLE analysis_jobs ADD COLUMN owner TEXT',
+    ]),
+]
+
+def get_schema_version(cursor):
+    """Get the highest applied migration version"""
+    cursor.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version')
+    return cursor.fetchone()[0]
+
+def run_migrations(conn):
+    """Apply pending migrations; safe to run on every start and against existing databases"""
+    cursor = conn.cursor()
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS schema_version (
+        version INTEGER PRIMARY KEY,
+        description TEXT NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+    ''')
+    conn.commit()
+    
+    for version, description, steps in MIGRATIONS:
+        if version <= get_schema_version(cursor):
+            continue
+        
+        # Take the write lock first so concurrent starts apply each migration once
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            if version <= get_schema_version(cursor):
+                conn.rollback()
+                continue
+            for step in steps:
+                if callable(step):
+                    step(cursor)
+                else:
+                    cursor.execute(step)
+            cursor.execute(
+                'INSERT INTO schema_version (version, description) VALUES (?, ?)',
+                (version, description)
+            )
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            print(f"Error applying migration {version} ({description}): {str(e)}")
+            raise
+
+def iter_skills(skills):
+    """Yield (skill, category) pairs from a skills list, a category dict or a comma/newline string"""
+    if isinstance(skills, dict):
+        for category, category_skills in skills.items():
+            for skill, _ in iter_skills(category_skills):
+                yield skill, category
+    elif isinstance(skills, str):
+        for skill in re.split(r'[,\n]', skills):
+            if skill.strip():
+                yield skill.strip(), 'general'
+    elif isinstance(skills, (list, tuple, set)):
+        for skill in skills:
+            if isinstance(skill, str) and skill.strip():
+                yield skill.strip(), 'general'
+
+def save_resume_skills(cursor, resume_id, skills):
+    """Write a resume's skills to resume_skills, creating canonical skill rows as needed"""
+    seen = set()
+    for skill, category in iter_skills(skills):
+        skill = ' '.join(skill.split())
+        name = skill.lower()
+        if not name or name in seen:
+            continue
+        seen.add(name)
+        
+        cursor.execute('INSERT OR IGNORE INTO skills (name, display_name) VALUES (?, ?)', (name, skill))
+        cursor.execute('SELECT id FROM skills WHERE name = ?', (name,))
+        skill_id = cursor.fetchone()[0]
+        cursor.execute('''
+        INSERT INTO resume_skills (resume_id, skill_id, skill_name, skill_category)
+        VALUES (?, ?, ?, ?)
+        ''', (resume_id, skill_id, skill, category))
+
+def backfill_resume_skills(cursor):
+    """Populate resume_skills from the str(list) blobs stored in resume_data.skills"""
+    rows = cursor.execute('''
+    SELECT id, skills FROM resume_data
+    WHERE skills IS NOT NULL
+      AND id NOT IN (SELECT resume_id FROM resume_skills WHERE resume_id IS NOT NULL)
+    ''').fetchall()
+    for resume_id, skills in rows:
+        try:
+            parsed = ast.literal_eval(skills)
+        except (ValueError, SyntaxError):
+            parsed = skills
+        save_resume_skills(cursor, resume_id, parsed)
+
+# Rollup rows are keyed on the day the resume was submitted, so an analysis
+# is counted against its resume's day, category and role
+def rebuild_rollups(cursor, since_day=None):
+    """Recompute dashboard rollups from the base tables, from since_day (YYYY-MM-DD) onwards"""
+    since_day = since_day or '0000-00-00'
+    cursor.execute('DELETE FROM dashboard_daily_rollup WHERE day >= ?', (since_day,))
+    cursor.execute('''
+    INSERT INTO dashboard_daily_rollup (
+        day, target_category, target_role, submissions,
+        analyses, ats_sum, keyword_sum, high_scoring
+    )
+    SELECT
+        DATE(rd.created_at),
+        COALESCE(rd.target_category, ''),
+        COALESCE(rd.target_role, ''),
+        COUNT(DISTINCT rd.id),
+        COUNT(ra.id),
+        COALESCE(SUM(ra.ats_score), 0),
+        COALESCE(SUM(ra.keyword_match_score), 0),
+        COUNT(DISTINCT CASE WHEN ra.ats_score >= 70 THEN rd.id END)
+    FROM resume_data rd
+    LEFT JOIN resume_analysis ra ON ra.resume_id = rd.id
+    WHERE rd.created_at >= ?
+    GROUP BY 1, 2, 3
+    ''', (since_day,))
+
+def refresh_dashboard_rollups(since_day=None):
+    """Catch-up job: rebuild rollups for rows written outside save_resume_data/save_analysis_data"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute('BEGIN IMMEDIATE')
+        rebuild_rollups(cursor, since_day)
+        conn.commit()
+        bump_data_version()
+        return True
+    except Exception as e:
+        print(f"Error refreshing dashboard rollups: {str(e)}")
+        conn.rollback()
+        return False
+    finally:
+        conn.close()
+
+def _add_submission_to_rollup(cursor, resume_id):
+    cursor.execute('''
+    INSERT INTO dashboard_daily_rollup (day, target_category, target_role, submissions)
+    SELECT DATE(created_at), COALESCE(target_category, ''), COALESCE(target_role, ''), 1
+    FROM resume_data
+    WHERE id = ?
+    ON CONFLICT (day, target_category, target_role)
+    DO UPDATE SET submissions = submissions + 1
+    ''', (resume_id,))
+
+def _add_analysis_to_rollup(cursor, analysis_id):
+    # A resume counts as high scoring once, however many of its analyses reach 70
+    cursor.execute('''
+    INSERT INTO dashboard_daily_rollup (
+        day, target_category, target_role, analyses, ats_sum, keyword_sum, high_scoring
+    )
+    SELECT
+        DATE(rd.created_at),
+        COALESCE(rd.target_category, ''),
+        COALESCE(rd.target_role, ''),
+        1,
+        ra.ats_score,
+        ra.keyword_match_score,
+        ra.ats_score >= 70 AND NOT EXISTS (
+            SELECT 1 FROM resume_analysis prev
+            WHERE prev.resume_id = ra.resume_id AND prev.id <> ra.id AND prev.ats_score >= 70
+        )
+    FROM resume_analysis ra
+    JOIN resume_data rd ON rd.id = ra.resume_id
+    WHERE ra.id = ?
+    ON CONFLICT (day, target_category, target_role)
+    DO UPDATE SET
+        analyses = analyses + 1,
+        ats_sum = ats_sum + excluded.ats_sum,
+        keyword_sum = keyword_sum + excluded.keyword_sum,
+        high_scoring = high_scoring + excluded.high_scoring
+    ''', (analysis_id,))
 
 def save_resume_data(data):
     """Save resume data to database"""
@@ -115,9 +515,13 @@ def save_resume_data(data):
             str(data.get('skills', [])),
             data.get('template', '')
         ))
+        resume_id = cursor.lastrowid
+        save_resume_skills(cursor, resume_id, data.get('skills', []))
+        _add_submission_to_rollup(cursor, resume_id)
         
         conn.commit()
-        return cursor.lastrowid
+        bump_data_version()
+        return resume_id
     except Exception as e:
         print(f"Error saving resume data: {str(e)}")
         conn.rollback()
@@ -146,14 +550,203 @@ def save_analysis_data(resume_id, analysis):
             analysis.get('missing_skills', ''),
             analysis.get('recommendations', '')
         ))
+        _add_analysis_to_rollup(cursor, cursor.lastrowid)
         
         conn.commit()
+        bump_data_version()
     except Exception as e:
         print(f"Error saving analysis data: {str(e)}")
         conn.rollback()
     finally:
         conn.close()
 
+def get_cached_analysis(cache_key):
+    """Get a stored analysis and its resume id by cache key"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute('''
+        SELECT resume_id, analysis
+        FROM analysis_cache
+        WHERE cache_key = ?
+        ''', (cache_key,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return {'resume_id': row[0], 'analysis': json.loads(row[1])}
+    except Exception as e:
+        print(f"Error getting cached analysis: {str(e)}")
+        return None
+    finally:
+        conn.close()
+
+def save_cached_analysis(cache_key, resume_id, analysis):
+    """Store an analysis under its cache key"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute('''
+        INSERT OR REPLACE INTO analysis_cache (cache_key, resume_id, analysis)
+        VALUES (?, ?, ?)
+        ''', (cache_key, resume_id, json.dumps(analysis)))
+        conn.commit()
+    except Exception as e:
+        print(f"Error saving cached analysis: {str(e)}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+def create_analysis_job(job_id, filename, category, role, cache_key, owner=None):
+    """Record a newly queued analysis job, owned by the process that will run it"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute('''
+        INSERT INTO analysis_jobs (id, filename, target_category, target_role, cache_key, owner)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ''', (job_id, filename, category, role, cache_key, owner))
+        conn.commit()
+    except Exception as e:
+        print(f"Error creating analysis job: {str(e)}")
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+def update_analysis_job(job_id, status=None, stage=None, result=None, error=None, resume_id=None):
+    """Update a job's status, stage and partial result; None leaves a field unchanged"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute('''
+        UPDATE analysis_jobs SET
+            status = COALESCE(?, status),
+            stage = COALESCE(?, stage),
+            result = COALESCE(?, result),
+            error = COALESCE(?, error),
+            resume_id = COALESCE(?, resume_id),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = ?
+        ''', (
+            status, stage, json.dumps(result) if result is not None else None,
+            error, resume_id, job_id
+        ))
+        conn.commit()
+    except Exception as e:
+        print(f"Error updating analysis job: {str(e)}")
+        conn.rollback()
+    finally:
+        conn.close()
+
+def get_analysis_job(job_id):
+    """Get a job as a dict with its decoded partial result, or None"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute('''
+        SELECT id, status, stage, filename, target_category, target_role,
+               cache_key, result, error, resume_id, created_at, updated_at
+        FROM analysis_jobs
+        WHERE id = ?
+        ''', (job_id,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        job = dict(zip((
+            'id', 'status', 'stage', 'filename', 'target_category', 'target_role',
+            'cache_key', 'result', 'error', 'resume_id', 'created_at', 'updated_at'
+        ), row))
+        job['result'] = json.loads(job['result']) if job['result'] else {}
+        return job
+    except Exception as e:
+        print(f"Error getting analysis job: {str(e)}")
+        return None
+    finally:
+        conn.close()
+
+def count_analysis_jobs():
+    """Get the number of jobs per status"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute('SELECT status, COUNT(*) FROM analysis_jobs GROUP BY status')
+        return dict(cursor.fetchall())
+    except Exception as e:
+        print(f"Error counting analysis jobs: {str(e)}")
+        return {}
+    finally:
+        conn.close()
+
+def get_unfinished_analysis_job_owners():
+    """Get the owners of jobs still queued or running"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute('''
+        SELECT DISTINCT owner FROM analysis_jobs
+        WHERE status IN ('queued', 'running') AND owner IS NOT NULL
+        ''')
+        return [row[0] for row in cursor.fetchall()]
+    except Exception as e:
+        print(f"Error getting analysis job owners: {str(e)}")
+        return []
+    finally:
+        conn.close()
+
+def fail_interrupted_analysis_jobs(owners):
+    """Mark jobs left queued or running by the given (exited) owners as failed
+
+    Uploads are held in memory only, so these jobs cannot be resumed. Jobs
+    without an owner predate the owner column and are failed as well.
+    """
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    owners = list(owners)
+    
+    try:
+        cursor.execute(f'''
+        UPDATE analysis_jobs
+        SET status = 'failed', error = 'Interrupted by an app restart, please upload again',
+            updated_at = CURRENT_TIMESTAMP
+        WHERE status IN ('queued', 'running')
+        AND (owner IS NULL OR owner IN ({', '.join('?' * len(owners)) or 'NULL'}))
+        ''', owners)
+        conn.commit()
+        return cursor.rowcount
+    except Exception as e:
+        print(f"Error failing interrupted analysis jobs: {str(e)}")
+        conn.rollback()
+        return 0
+    finally:
+        conn.close()
+
+def delete_finished_analysis_jobs(older_than_days=1):
+    """Delete done and failed jobs older than the given number of days"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute('''
+        DELETE FROM analysis_jobs
+        WHERE status IN ('done', 'failed')
+        AND updated_at < datetime('now', ?)
+        ''', (f'-{int(older_than_days)} days',))
+        conn.commit()
+        return cursor.rowcount
+    except Exception as e:
+        print(f"Error deleting finished analysis jobs: {str(e)}")
+        conn.rollback()
+        return 0
+    finally:
+        conn.close()
+
 def get_resume_stats():
     """Get statistics about resumes"""
     conn = get_database_connection()
@@ -222,14 +815,15 @@ def get_admin_logs():
     finally:
         conn.close()
 
-def get_all_resume_data():
-    """Get all resume data for admin dashboard"""
+def get_all_resume_data(filters=None):
+    """Get all resume data for admin dashboard (prefer get_resume_page for display)"""
     conn = get_database_connection()
     cursor = conn.cursor()
     
     try:
+        where, params = build_resume_filters(**(filters or {}))
         # Get resume data joined with analysis data
-        cursor.execute('''
+        cursor.execute(f'''
         SELECT 
             r.id,
             r.name,
@@ -247,8 +841,9 @@ def get_all_resume_data():
             a.section_score
         FROM resume_data r
         LEFT JOIN resume_analysis a ON r.id = a.resume_id
+        {where}
         ORDER BY r.created_at DESC
-        ''')
+        ''', params)
         return cursor.fetchall()
     except Exception as e:
         print(f"Error getting resume data: {str(e)}")
@@ -256,6 +851,141 @@ def get_all_resume_data():
     finally:
         conn.close()
 
+# Sortable columns of the submissions table -> SQL expression. NULL scores sort
+# as -1 so keyset comparisons never see NULL.
+RESUME_SORT_COLUMNS = {
+    'created_at': 'r.created_at',
+    'name': "COALESCE(r.name, '')",
+    'ats_score': 'COALESCE(a.ats_score, -1)',
+    'keyword_match_score': 'COALESCE(a.keyword_match_score, -1)',
+}
+
+def build_resume_filters(start_date=None, end_date=None, category=None, role=None, min_score=None):
+    """Build the WHERE clause and parameters for the submission filters (all optional)"""
+    clauses = []
+    params = []
+    if start_date:
+        clauses.append('r.created_at >= ?')
+        params.append(str(start_date))
+    if end_date:
+        # Dates are inclusive: anything before the start of the following day
+        clauses.append("r.created_at < DATE(?, '+1 day')")
+        params.append(str(end_date))
+    if category:
+        clauses.append('r.target_category = ?')
+        params.append(category)
+    if role:
+        clauses.append('r.target_role = ?')
+        params.append(role)
+    if min_score is not None:
+        clauses.append('a.ats_score >= ?')
+        params.append(float(min_score))
+    where = 'WHERE ' + ' AND '.join(clauses) if clauses else ''
+    return where, params
+
+def get_resume_page(filters=None, sort_by='created_at', descending=True, after=None, page_size=50):
+    """Get one page of submissions joined with their analyses, using keyset pagination
+
+    ``filters`` holds build_resume_filters() arguments. ``after`` is the
+    cursor returned with the previous page. Returns (rows, next_cursor);
+    next_cursor is None on the last page.
+    """
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        sort_expression = RESUME_SORT_COLUMNS[sort_by]
+        where, params = build_resume_filters(**(filters or {}))
+        
+        # Ties are broken on (resume id, analysis id) so every row has a unique position
+        if after is not None:
+            comparison = '<' if descending else '>'
+            keyset = f'({sort_expression}, r.id, COALESCE(a.id, 0)) {comparison} (?, ?, ?)'
+            where = f'{where} AND {keyset}' if where else f'WHERE {keyset}'
+            params = params + list(after)
+        
+        direction = 'DESC' if descending else 'ASC'
+        cursor.execute(f'''
+        SELECT 
+            r.id,
+            r.name,
+            r.email,
+            r.phone,
+            r.linkedin,
+            r.github,
+            r.portfolio,
+            r.target_role,
+            r.target_category,
+            r.created_at,
+            a.ats_score,
+            a.keyword_match_score,
+            a.format_score,
+            a.section_score,
+            {sort_expression},
+            COALESCE(a.id, 0)
+        FROM resume_data r
+        LEFT JOIN resume_analysis a ON r.id = a.resume_id
+        {where}
+        ORDER BY {sort_expression} {direction}, r.id {direction}, COALESCE(a.id, 0) {direction}
+        LIMIT ?
+        ''', params + [page_size + 1])
+        rows = cursor.fetchall()
+        
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last = rows[-1]
+            next_cursor = (last[-2], last[0], last[-1])
+        return [row[:-2] for row in rows], next_cursor
+    except Exception as e:
+        print(f"Error getting resume page: {str(e)}")
+        return [], None
+    finally:
+        conn.close()
+
+def count_resume_data(filters=None):
+    """Count the submission rows matching the filters"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        where, params = build_resume_filters(**(filters or {}))
+        cursor.execute(f'''
+        SELECT COUNT(*)
+        FROM resume_data r
+        LEFT JOIN resume_analysis a ON r.id = a.resume_id
+        {where}
+        ''', params)
+        return cursor.fetchone()[0]
+    except Exception as e:
+        print(f"Error counting resume data: {str(e)}")
+        return 0
+    finally:
+        conn.close()
+
+def get_resume_filter_options():
+    """Get the distinct categories and roles that have submissions"""
+    conn = get_database_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute('''
+        SELECT DISTINCT target_category FROM dashboard_daily_rollup
+        WHERE target_category <> '' ORDER BY target_category
+        ''')
+        categories = [row[0] for row in cursor.fetchall()]
+        cursor.execute('''
+        SELECT DISTINCT target_role FROM dashboard_daily_rollup
+        WHERE target_role <> '' ORDER BY target_role
+        ''')
+        roles = [row[0] for row in cursor.fetchall()]
+        return categories, roles
+    except Exception as e:
+        print(f"Error getting resume filter options: {str(e)}")
+        return [], []
+    finally:
+        conn.close()
+
 def verify_admin(email, password):
     """Verify admin credentials"""
     conn = get_database_connection()
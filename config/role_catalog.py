@@ -0,0 +1,262 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+from array import array
+
+from config.job_roles import JOB_ROLES
+
+MASTER_ROLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'complete_tech_roles_master.json')
+
+# Parsed catalogs are cached per user, never inside the package
+CATALOG_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'smart-resume-ai'
+)
+# Bump when the cached layout changes so stale caches are rebuilt
+CACHE_FORMAT_VERSION = 2
+
+
+def iter_catalog_records(data):
+    """Yield (category, role, info) from a parsed catalog
+
+    Accepts the nested ``{category: {role: info}}`` layout used by
+    JOB_ROLES and the master JSON, or a flat list of records with
+    ``category``, ``role`` (or ``title``), ``required_skills`` (or
+    ``skills``) and ``description`` keys, as exported by most job taxonomies.
+    """
+    if isinstance(data, dict):
+        for category, roles in data.items():
+            for role, info in roles.items():
+                yield category, role, info
+    else:
+        for record in data:
+            info = dict(record)
+            info.setdefault('required_skills', record.get('skills', []))
+            yield record.get('category') or 'Other', record.get('role') or record.get('title'), info
+
+
+class RoleCatalog:
+    """Compact, read-only role catalog
+
+    Skills are interned and numbered once; each role stores its required
+    skills as a slice of one flat ``array`` of skill ids (CSR layout), so a
+    catalog of tens of thousands of roles costs a few bytes per role-skill
+    pair instead of a list of strings per role.
+    """
+
+    def __init__(self, categories, skills, role_names, role_categories, descriptions,
+                 skill_offsets, skill_ids):
+        self.categories = categories            # [name]
+        self.skills = skills                    # skill id -> display spelling
+        self.role_names = role_names            # role id -> name
+        self.role_categories = role_categories  # role id -> category index
+        self.descriptions = descriptions        # role id -> description
+        self.skill_offsets = skill_offsets      # role id -> start in skill_ids (len = roles + 1)
+        self.skill_ids = skill_ids              # flat skill ids for every role
+        self.skill_id_by_key = {skill.lower(): skill_id for skill_id, skill in enumerate(skills)}
+        self.role_id_by_key = {
+            (categories[category], name): role_id
+            for role_id, (name, category) in enumerate(zip(role_names, role_categories))
+        }
+        self._roles_by_skill = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_records(cls, records):
+        """Build a catalog from (category, role, info) records, merging repeated roles"""
+        categories, category_index = [], {}
+        skills, skill_index = [], {}
+        role_skills, role_info = {}, {}
+
+        for category, role, info in records:
+            if not role:
+                continue
+            if category not in category_index:
+                category_index[category] = len(categories)
+                categories.append(sys.intern(category))
+            key = (category_index[category], role)
+            if key not in role_skills:
+                role_skills[key] = {}
+                role_info[key] = info.get('description', '')
+            for skill in info.get('required_skills', []):
+                skill_key = skill.lower()
+                if skill_key not in skill_index:
+                    skill_index[skill_key] = len(skills)
+                    skills.append(sys.intern(skill))
+                role_skills[key].setdefault(skill_index[skill_key], None)
+
+        role_names, role_categories, descriptions = [], array('I'), []
+        skill_offsets, skill_ids = array('I', [0]), array('I')
+        for (category, role), ids in role_skills.items():
+            role_names.append(sys.intern(role))
+            role_categories.append(category)
+            descriptions.append(role_info[(category, role)])
+            skill_ids.extend(ids)
+            skill_offsets.append(len(skill_ids))
+
+        return cls(categories, skills, role_names, role_categories, descriptions, skill_offsets, skill_ids)
+
+    def __len__(self):
+        return len(self.role_names)
+
+    def role_skill_ids(self, role_id):
+        """Get the skill ids required by a role"""
+        return self.skill_ids[self.skill_offsets[role_id]:self.skill_offsets[role_id + 1]]
+
+    def get(self, role_id):
+        """Get a role as {'category', 'role', 'description', 'required_skills'}"""
+        return {
+            'category': self.categories[self.role_categories[role_id]],
+            'role': self.role_names[role_id],
+            'description': self.descriptions[role_id],
+            'required_skills': [self.skills[skill_id] for skill_id in self.role_skill_ids(role_id)]
+        }
+
+    def find(self, role, category=None):
+        """Get a role id by name (and category), or None"""
+        if category is not None:
+            return self.role_id_by_key.get((category, role))
+        for role_id, name in enumerate(self.role_names):
+            if name == role:
+                return role_id
+        return None
+
+    @property
+    def roles_by_skill(self):
+        """Inverted index: skill id -> tuple of role ids, built on first use"""
+        with self._lock:
+            if self._roles_by_skill is None:
+                index = [[] for _ in self.skills]
+                for role_id in range(len(self)):
+                    for skill_id in self.role_skill_ids(role_id):
+                        index[skill_id].append(role_id)
+                self._roles_by_skill = [tuple(role_ids) for role_ids in index]
+            return self._roles_by_skill
+
+    def write_cache(self, path, signature):
+        """Write the catalog as a JSON header line followed by the raw id arrays
+
+        Neither part can execute code when read back, unlike a pickle.
+        """
+        arrays = (self.role_categories, self.skill_offsets, self.skill_ids)
+        header = {
+            'version': CACHE_FORMAT_VERSION,
+            'signature': signature,
+            'byteorder': sys.byteorder,
+            'itemsize': self.skill_ids.itemsize,
+            'lengths': [len(values) for values in arrays],
+            'categories': self.categories,
+            'skills': self.skills,
+            'role_names': self.role_names,
+            'descriptions': self.descriptions,
+        }
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(json.dumps(header).encode('utf-8') + b'\n')
+            for values in arrays:
+                values.tofile(f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def read_cache(cls, path, signature):
+        """Load a catalog written by write_cache, or None when it is stale or from another platform"""
+        with open(path, 'rb') as f:
+            header = json.loads(f.readline())
+            if (header.get('version') != CACHE_FORMAT_VERSION or header.get('signature') != signature
+                    or header.get('byteorder') != sys.byteorder or header.get('itemsize') != array('I').itemsize):
+                return None
+            arrays = []
+            for length in header['lengths']:
+                values = array('I')
+                values.fromfile(f, length)
+                arrays.append(values)
+        role_categories, skill_offsets, skill_ids = arrays
+        return cls(
+            [sys.intern(name) for name in header['categories']],
+            [sys.intern(skill) for skill in header['skills']],
+            [sys.intern(name) for name in header['role_names']],
+            role_categories,
+            header['descriptions'],
+            skill_offsets,
+            skill_ids,
+        )
+
+
+def _source_signature(paths):
+    signature = []
+    for path in paths:
+        stat = os.stat(path)
+        signature.append([os.path.abspath(path), stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+def _job_roles_digest():
+    """Hash of JOB_ROLES, so edits to config/job_roles.py invalidate the cache"""
+    return hashlib.sha1(json.dumps(JOB_ROLES, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _default_cache_path(paths, include_job_roles):
+    """One cache file per set of sources, named by a hash of their paths"""
+    key = json.dumps([[os.path.abspath(path) for path in paths], include_job_roles])
+    return os.path.join(CATALOG_CACHE_DIR, f"role-catalog-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.bin")
+
+
+def _load_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_role_catalog(paths=(MASTER_ROLES_PATH,), include_job_roles=True, cache_path=None):
+    """Load catalogs into one RoleCatalog, reusing the binary cache when the sources (and JOB_ROLES) are unchanged
+
+    JOB_ROLES comes first, so its skill order wins for roles that also
+    appear in a JSON catalog; extra skills from later sources are appended.
+    The cache goes to CATALOG_CACHE_DIR unless ``cache_path`` is given; an
+    unwritable location just skips caching.
+    """
+    paths = [path for path in paths if os.path.exists(path)]
+    signature = {
+        'job_roles': _job_roles_digest() if include_job_roles else None,
+        'sources': _source_signature(paths),
+    }
+    if cache_path is None and paths:
+        cache_path = _default_cache_path(paths, include_job_roles)
+
+    if cache_path and os.path.exists(cache_path):
+        try:
+            catalog = RoleCatalog.read_cache(cache_path, signature)
+            if catalog is not None:
+                return catalog
+        except Exception as e:
+            print(f"Error reading role catalog cache: {str(e)}")
+
+    def records():
+        if include_job_roles:
+            yield from iter_catalog_records(JOB_ROLES)
+        for path in paths:
+            yield from iter_catalog_records(_load_json(path))
+
+    catalog = RoleCatalog.from_records(records())
+
+    if cache_path:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(cache_path)), exist_ok=True)
+            catalog.write_cache(cache_path, signature)
+        except OSError as e:
+            print(f"Error writing role catalog cache: {str(e)}")
+    return catalog
+
+
+_role_catalog = None
+_role_catalog_lock = threading.Lock()
+
+
+def get_role_catalog():
+    """Get the process-wide catalog of JOB_ROLES plus the master JSON, loaded on first use"""
+    global _role_catalog
+    with _role_catalog_lock:
+        if _role_catalog is None:
+            _role_catalog = load_role_catalog()
+        return _role_catalog
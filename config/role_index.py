@@ -0,0 +1,48 @@
+from types import MappingProxyType
+
+from config.courses import COURSES_BY_CATEGORY
+from config.job_roles import JOB_ROLES
+
+
+class RoleIndex:
+    """Read-only lookup tables over JOB_ROLES and COURSES_BY_CATEGORY, built once at import
+
+    - ``categories`` / ``roles_by_category``: selectbox options in catalog order
+    - ``role_category``: role -> its JOB_ROLES category
+    - ``course_category``: role -> its COURSES_BY_CATEGORY category (get_category_for_role)
+    - ``role_courses``: role -> courses, as (title, url) tuples
+
+    Skill -> role lookups live in config.role_catalog (RoleCatalog.roles_by_skill).
+    """
+
+    def __init__(self, job_roles, courses_by_category):
+        self.job_roles = job_roles
+        self.categories = tuple(job_roles)
+        self.roles_by_category = MappingProxyType({
+            category: tuple(roles) for category, roles in job_roles.items()
+        })
+
+        role_category = {}
+        for category, roles in job_roles.items():
+            for role in roles:
+                role_category.setdefault(role, category)
+
+        course_category = {}
+        role_courses = {}
+        for category, roles in courses_by_category.items():
+            for role, courses in roles.items():
+                course_category.setdefault(role, category)
+                role_courses.setdefault(role, tuple(tuple(course) for course in courses))
+
+        self.role_category = MappingProxyType(role_category)
+        self.course_category = MappingProxyType(course_category)
+        self.role_courses = MappingProxyType(role_courses)
+
+    def get_role_info(self, role, category=None):
+        """Get a role's job_roles entry, returning (category, role_info) or (None, None)"""
+        category = category or self.role_category.get(role)
+        role_info = self.job_roles.get(category, {}).get(role) if category else None
+        return (category, role_info) if role_info else (None, None)
+
+
+ROLE_INDEX = RoleIndex(JOB_ROLES, COURSES_BY_CATEGORY)
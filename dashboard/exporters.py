@@ -0,0 +1,266 @@
+import csv
+import io
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+from config.database import get_database_connection, build_resume_filters
+
+EXPORT_COLUMNS = [
+    'name', 'email', 'phone', 'linkedin', 'github', 'portfolio',
+    'summary', 'target_role', 'target_category',
+    'education', 'experience', 'projects', 'skills',
+    'ats_score', 'keyword_match_score', 'format_score', 'section_score',
+    'missing_skills', 'recommendations',
+    'created_at'
+]
+
+EXPORT_QUERY = """
+    SELECT
+        r.name, r.email, r.phone, r.linkedin, r.github, r.portfolio,
+        r.summary, r.target_role, r.target_category,
+        r.education, r.experience, r.projects, r.skills,
+        a.ats_score, a.keyword_match_score, a.format_score, a.section_score,
+        a.missing_skills, a.recommendations,
+        r.created_at
+    FROM resume_data r
+    LEFT JOIN resume_analysis a ON r.id = a.resume_id
+    {where}
+    ORDER BY r.created_at, r.id
+"""
+
+# Rows fetched from SQLite per round trip
+EXPORT_CHUNK_SIZE = 1000
+
+# Exports smaller than this stay in memory; larger ones spill to a temp file
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+def iter_export_chunks(filters=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield lists of export rows, reading the joined table chunk by chunk"""
+    conn = get_database_connection()
+    try:
+        where, params = build_resume_filters(**(filters or {}))
+        cursor = conn.cursor()
+        cursor.execute(EXPORT_QUERY.format(where=where), params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield rows
+    finally:
+        conn.close()
+
+
+def write_csv(stream, filters=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Write the export as CSV to a binary stream"""
+    text = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+    writer = csv.writer(text)
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in iter_export_chunks(filters, chunk_size):
+        writer.writerows(rows)
+    text.flush()
+    text.detach()
+
+
+def write_ndjson(stream, filters=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Write the export as newline-delimited JSON (one object per row) to a binary stream"""
+    for rows in iter_export_chunks(filters, chunk_size):
+        stream.write(''.join(
+            json.dumps(dict(zip(EXPORT_COLUMNS, row))) + '\n' for row in rows
+        ).encode('utf-8'))
+
+
+def write_xlsx(stream, filters=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Write the export as an Excel workbook, flushing each row as it is written"""
+    import xlsxwriter
+
+    # constant_memory keeps only the current row in memory
+    workbook = xlsxwriter.Workbook(stream, {'constant_memory': True})
+    worksheet = workbook.add_worksheet('Resume Data')
+    header_format = workbook.add_format({
+        'bold': True,
+        'text_wrap': True,
+        'valign': 'top',
+        'fg_color': '#D7E4BC',
+        'border': 1
+    })
+
+    widths = [len(column) for column in EXPORT_COLUMNS]
+    worksheet.write_row(0, 0, EXPORT_COLUMNS, header_format)
+    row_num = 1
+    for rows in iter_export_chunks(filters, chunk_size):
+        for row in rows:
+            worksheet.write_row(row_num, 0, row)
+            for i, value in enumerate(row):
+                if value is not None:
+                    widths[i] = max(widths[i], len(str(value)))
+            row_num += 1
+
+    # Column widths are written when the workbook is closed
+    for i, width in enumerate(widths):
+        worksheet.set_column(i, i, min(width + 2, 50))
+    workbook.close()
+
+
+WRITERS = {
+    'csv': write_csv,
+    'ndjson': write_ndjson,
+    'xlsx': write_xlsx,
+}
+
+
+def export_resume_data(export_format, filters=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Export submissions and return the file contents as bytes
+
+    Rows are written in chunks to a spooled temporary file (moved to disk
+    past SPOOL_MAX_SIZE) and read back once at the end, since
+    st.download_button needs bytes. ``filters`` takes the same keys as
+    ``build_resume_filters`` (date range, category, role, minimum ATS score).
+    """
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as output:
+        WRITERS[export_format](output, filters, chunk_size)
+        output.seek(0)
+        return output.read()
+
+
+PARQUET_SNAPSHOT_DIR = 'exports/parquet'
+PARQUET_MANIFEST = '_snapshot.json'
+# Bump when the snapshot rows change meaning; older snapshots are rebuilt in full
+PARQUET_SNAPSHOT_FORMAT = 2
+
+PARQUET_QUERY = """
+    SELECT
+        r.id, a.id,
+        r.name, r.email, r.phone, r.linkedin, r.github, r.portfolio,
+        r.summary, r.target_role, r.target_category,
+        r.education, r.experience, r.projects, r.skills,
+        (
+            SELECT json_group_array(s.display_name)
+            FROM resume_skills rs
+            JOIN skills s ON s.id = rs.skill_id
+            WHERE rs.resume_id = r.id
+        ),
+        a.ats_score, a.keyword_match_score, a.format_score, a.section_score,
+        a.missing_skills, a.recommendations,
+        r.created_at
+    FROM resume_analysis a
+    JOIN resume_data r ON r.id = a.resume_id
+    WHERE a.id > ?
+    ORDER BY a.id
+"""
+
+
+def _parquet_schema():
+    import pyarrow as pa
+
+    text = pa.string()
+    score = pa.float64()
+    return pa.schema([
+        ('resume_id', pa.int64()), ('analysis_id', pa.int64()),
+        ('name', text), ('email', text), ('phone', text), ('linkedin', text),
+        ('github', text), ('portfolio', text), ('summary', text),
+        ('target_role', text), ('target_category', text),
+        ('education', text), ('experience', text), ('projects', text), ('skills', text),
+        ('skill_names', pa.list_(text)),
+        ('ats_score', score), ('keyword_match_score', score),
+        ('format_score', score), ('section_score', score),
+        ('missing_skills', text), ('recommendations', text),
+        ('created_at', text),
+        # Partition columns
+        ('month', text), ('category', text),
+    ])
+
+
+def _read_manifest(directory):
+    path = os.path.join(directory, PARQUET_MANIFEST)
+    if not os.path.exists(path):
+        return {'format': PARQUET_SNAPSHOT_FORMAT, 'last_analysis_id': 0, 'snapshots': 0}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_manifest(directory, manifest):
+    path = os.path.join(directory, PARQUET_MANIFEST)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + '.tmp', path)
+
+
+def export_parquet_snapshot(directory=PARQUET_SNAPSHOT_DIR, incremental=True, chunk_size=EXPORT_CHUNK_SIZE):
+    """Write submissions, analyses and normalized skills as Parquet partitioned by month and category
+
+    Files are laid out as ``month=YYYY-MM/category=<name>/`` so pandas,
+    pyarrow and DuckDB can prune partitions. There is one row per analysis;
+    a resume joins the snapshot once it has been analyzed, so rows are
+    never superseded and appending stays exact. With ``incremental`` only
+    analyses newer than the last snapshot (tracked in ``_snapshot.json``)
+    are appended; otherwise existing partitions are replaced by a full
+    snapshot. Requires pyarrow.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    os.makedirs(directory, exist_ok=True)
+    manifest = _read_manifest(directory)
+    if not incremental or manifest.get('format') != PARQUET_SNAPSHOT_FORMAT:
+        for entry in os.listdir(directory):
+            if entry.startswith('month='):
+                shutil.rmtree(os.path.join(directory, entry))
+        manifest = {'format': PARQUET_SNAPSHOT_FORMAT, 'last_analysis_id': 0,
+                    'snapshots': manifest.get('snapshots', 0)}
+    schema = _parquet_schema()
+
+    snapshot = manifest['snapshots'] + 1
+    last_analysis_id = manifest['last_analysis_id']
+    row_count = 0
+
+    conn = get_database_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(PARQUET_QUERY, (last_analysis_id,))
+        chunk = 0
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+
+            columns = [list(column) for column in zip(*rows)]
+            columns[15] = [json.loads(names) if names else [] for names in columns[15]]
+            created_at = columns[-1]
+            categories = columns[10]
+            columns.append([str(value or '')[:7] or 'unknown' for value in created_at])
+            columns.append([category or 'Other' for category in categories])
+
+            table = pa.Table.from_arrays(
+                [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+                schema=schema
+            )
+            pq.write_to_dataset(
+                table,
+                root_path=directory,
+                partition_cols=['month', 'category'],
+                basename_template=f'snapshot-{snapshot:05d}-{chunk:05d}-{{i}}.parquet',
+                existing_data_behavior='overwrite_or_ignore'
+            )
+
+            last_analysis_id = max(last_analysis_id, max(columns[1]))
+            row_count += len(rows)
+            chunk += 1
+    finally:
+        conn.close()
+
+    if row_count:
+        manifest.update({
+            'last_analysis_id': last_analysis_id,
+            'snapshots': snapshot,
+            'updated_at': datetime.now().isoformat(timespec='seconds')
+        })
+        _write_manifest(directory, manifest)
+
+    return {'rows': row_count, 'snapshot': snapshot if row_count else manifest['snapshots'], 'directory': directory}
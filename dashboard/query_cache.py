@@ -0,0 +1,105 @@
+import functools
+import threading
+import time
+
+from config.database import get_data_version
+from utils.metrics import get_metrics
+
+# Seconds a dashboard query result is served before it is recomputed
+QUERY_CACHE_TTL = 30
+
+
+class QueryCache:
+    """Process-wide cache of dashboard query results
+
+    An entry is served until its TTL runs out or until a resume/analysis
+    write bumps the database data version, whichever comes first. The TTL
+    bounds staleness for writes made by other processes.
+    """
+
+    def __init__(self, ttl=QUERY_CACHE_TTL):
+        self.ttl = ttl
+        self._entries = {}  # key -> (data_version, expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for key, computing and storing it when missing or stale"""
+        version = get_data_version()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry_version, expires_at, value = entry
+                if entry_version == version and now < expires_at:
+                    self.hits += 1
+                    return value
+                if entry_version != version:
+                    self.invalidations += 1
+            self.misses += 1
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = (version, time.monotonic() + self.ttl, value)
+        return value
+
+    def clear(self):
+        """Drop every cached result"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Get hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'invalidations': self.invalidations,
+                'hit_rate': round(self.hits / lookups * 100, 1) if lookups else 0.0,
+                'entries': len(self._entries),
+                'ttl': self.ttl
+            }
+
+
+_query_cache = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_cache(ttl=None):
+    """Get the process-wide query cache (kept across Streamlit reruns), optionally changing its TTL"""
+    global _query_cache
+    with _query_cache_lock:
+        if _query_cache is None:
+            _query_cache = QueryCache()
+        if ttl is not None:
+            _query_cache.ttl = ttl
+        return _query_cache
+
+
+def cached_query(method):
+    """Serve a DashboardManager query method from the instance's query cache
+
+    Cache lookups are counted per method and the queries that do run are
+    timed in the app metrics registry.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (name, args, tuple(sorted(kwargs.items())))
+        metrics = get_metrics()
+        computed = False
+
+        def compute():
+            nonlocal computed
+            computed = True
+            with metrics.time('dashboard_query_seconds', method=name):
+                return method(self, *args, **kwargs)
+
+        value = self.query_cache.get_or_compute(key, compute)
+        metrics.inc('dashboard_queries_total', method=name, cache='miss' if computed else 'hit')
+        return value
+    return wrapper
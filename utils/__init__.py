@@ -1,9 +1,25 @@
 """
 Utils package for Smart Resume AI
+
+Package-level names are imported on first use, so importing one module
+(e.g. utils.resume_analyzer from the CLI) does not pull in sqlalchemy.
 """
+import importlib
+
+_LAZY_CLASSES = {
+    'ResumeAnalyzer': '.resume_analyzer',
+    'ResumeBuilder': '.resume_builder',
+    'ResumeParser': '.resume_parser',
+    #'ExcelManager': '.excel_manager',
+}
+
 
-from .resume_analyzer import ResumeAnalyzer
-from .resume_builder import ResumeBuilder
-from .resume_parser import ResumeParser
-#from .excel_manager import ExcelManager
-from .database import * 
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    # Everything else used to come in through "from .database import *"
+    module = importlib.import_module(_LAZY_CLASSES.get(name, '.database'), __name__)
+    try:
+        return getattr(module, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
@@ -0,0 +1,86 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from config.database import get_cached_analysis, save_cached_analysis
+
+
+class AnalysisCache:
+    """Two-level cache of resume analyses keyed on file content and target role
+
+    Lookups check an in-memory LRU first and fall back to the SQLite
+    ``analysis_cache`` table, which survives restarts and is shared
+    between processes.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(file_bytes, category, role):
+        """Build a cache key from the SHA-256 of the upload and the selected role"""
+        digest = hashlib.sha256(file_bytes).hexdigest()
+        return f"{digest}:{category}:{role}"
+
+    def get(self, key):
+        """Return the cached {'resume_id', 'analysis'} entry, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.memory_hits += 1
+                return entry
+
+        entry = get_cached_analysis(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.db_hits += 1
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key, analysis, resume_id):
+        """Store an analysis in memory and in the database"""
+        entry = {'resume_id': resume_id, 'analysis': analysis}
+        with self._lock:
+            self._remember(key, entry)
+        save_cached_analysis(key, resume_id, analysis)
+
+    def _remember(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self):
+        """Get hit/miss counters"""
+        with self._lock:
+            hits = self.memory_hits + self.db_hits
+            lookups = hits + self.misses
+            return {
+                'hits': hits,
+                'memory_hits': self.memory_hits,
+                'db_hits': self.db_hits,
+                'misses': self.misses,
+                'hit_rate': round(hits / lookups * 100, 1) if lookups else 0.0,
+                'entries': len(self._entries)
+            }
+
+
+_analysis_cache = None
+_analysis_cache_lock = threading.Lock()
+
+
+def get_analysis_cache():
+    """Get the process-wide analysis cache (kept across Streamlit reruns)"""
+    global _analysis_cache
+    with _analysis_cache_lock:
+        if _analysis_cache is None:
+            _analysis_cache = AnalysisCache()
+        return _analysis_cache
@@ -0,0 +1,184 @@
+import os
+import socket
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from config.database import (
+    count_analysis_jobs, create_analysis_job, delete_finished_analysis_jobs,
+    fail_interrupted_analysis_jobs, get_analysis_job, get_unfinished_analysis_job_owners,
+    save_analysis_data, save_resume_data, update_analysis_job
+)
+from .analysis_cache import get_analysis_cache
+from .instrumentation import Instrumentation
+from .metrics import AnalysisMetricsSink, get_metrics
+from .resume_analyzer import ResumeAnalyzer
+from .text_extraction import detect_format
+
+# Analyses running at once; further uploads wait in the queue
+ANALYSIS_WORKERS = 2
+
+# Stages a job goes through, in order; partial results grow at each one
+JOB_STAGES = ['queued', 'extracting', 'document_type', 'scores', 'suggestions', 'done']
+
+# analyze_resume fields published at the 'scores' stage, before suggestions
+SCORE_FIELDS = (
+    'document_type', 'ats_score', 'keyword_match', 'section_score',
+    'format_score', 'section_scores', 'name', 'email', 'phone', 'linkedin', 'github'
+)
+
+# Owner recorded on this process's jobs: host, pid and a token that tells
+# a restarted app apart from an earlier process that had the same pid
+JOB_OWNER = f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+
+
+def _owner_exited(owner):
+    """True when a job owner is a process on this host that is no longer running"""
+    host, pid, token = owner.rsplit(':', 2)
+    if host != socket.gethostname() or not pid.isdigit():
+        return False
+    if int(pid) == os.getpid():
+        return owner != JOB_OWNER
+    if os.name == 'nt':
+        # Signal 0 is not a liveness probe on Windows; leave other processes' jobs alone
+        return False
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return True
+    except OSError:
+        return False
+    return False
+
+
+class AnalysisJobQueue:
+    """Runs uploaded resume analyses on a worker pool, off the Streamlit script thread
+
+    Each job's status, stage and partial result are stored in the
+    ``analysis_jobs`` table, so any rerun or session can poll them by job
+    id. A job publishes the document type first (from the first page of a
+    PDF), then the scores, then the full analysis with suggestions and role
+    matches, and finally saves the resume and analysis rows.
+    """
+
+    def __init__(self, analyzer=None, workers=ANALYSIS_WORKERS):
+        self.metrics = get_metrics()
+        self.analyzer = analyzer or ResumeAnalyzer(Instrumentation([AnalysisMetricsSink(self.metrics)]))
+        self.analysis_cache = get_analysis_cache()
+        self.workers = workers
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='analysis-job')
+
+    def submit(self, file_bytes, filename, mime, category, role, role_info, cache_key=None):
+        """Queue an upload for analysis and return its job id"""
+        job_id = uuid.uuid4().hex
+        create_analysis_job(job_id, filename, category, role, cache_key, owner=JOB_OWNER)
+        self.executor.submit(self._run, job_id, file_bytes, filename, mime, category, role, role_info, cache_key)
+        return job_id
+
+    def get(self, job_id):
+        """Get a job's status, stage and partial result"""
+        return get_analysis_job(job_id)
+
+    def _run(self, job_id, *args):
+        try:
+            self._analyze(job_id, *args)
+        except Exception as e:
+            print(f"Error running analysis job {job_id}: {str(e)}")
+            update_analysis_job(job_id, status='failed', error=str(e))
+
+    def _analyze(self, job_id, file_bytes, filename, mime, category, role, role_info, cache_key):
+        analyzer = self.analyzer
+        file_type = os.path.splitext(filename)[1].lstrip('.').lower() or 'unknown'
+        update_analysis_job(job_id, status='running', stage='extracting')
+
+        # A long PDF's type is known from its first page, well before full extraction ends
+        if detect_format(file_bytes, filename=filename, mime=mime) == 'pdf':
+            first_page = analyzer.extract_text(file_bytes, filename=filename, mime=mime, max_pages=1)
+            update_analysis_job(job_id, stage='document_type',
+                                result={'document_type': analyzer.detect_document_type(first_page)})
+
+        # Single process: forking a page pool from these worker threads is unsafe
+        with self.metrics.time('extraction_seconds', file_type=file_type):
+            text = analyzer.extract_text(file_bytes, filename=filename, mime=mime, workers=1)
+        update_analysis_job(job_id, stage='document_type',
+                            result={'document_type': analyzer.detect_document_type(text)})
+
+        analysis = analyzer.analyze_resume({'raw_text': text, 'filename': filename}, role_info)
+        update_analysis_job(job_id, stage='scores',
+                            result={field: analysis[field] for field in SCORE_FIELDS if field in analysis})
+
+        analysis['role_matches'] = analyzer.rank_roles(text, top_k=5)
+        update_analysis_job(job_id, stage='suggestions', result=analysis)
+
+        resume_id = self._save(analysis, category, role)
+        if resume_id is not None and cache_key:
+            self.analysis_cache.put(cache_key, analysis, resume_id)
+        self.metrics.inc('uploads_analyzed_total', file_type=file_type, cache='miss')
+        update_analysis_job(job_id, status='done', stage='done', resume_id=resume_id)
+
+    def _save(self, analysis, category, role):
+        """Save the resume and analysis rows, returning the resume id (None when saving failed)"""
+        resume_data = {
+            'personal_info': {
+                'name': analysis.get('name', ''),
+                'email': analysis.get('email', ''),
+                'phone': analysis.get('phone', ''),
+                'linkedin': analysis.get('linkedin', ''),
+                'github': analysis.get('github', ''),
+                'portfolio': analysis.get('portfolio', '')
+            },
+            'summary': analysis.get('summary', ''),
+            'target_role': role,
+            'target_category': category,
+            'education': analysis.get('education', []),
+            'experience': analysis.get('experience', []),
+            'projects': analysis.get('projects', []),
+            'skills': analysis.get('skills', []),
+            'template': ''
+        }
+        with self.metrics.time('db_write_seconds', table='resume_data'):
+            resume_id = save_resume_data(resume_data)
+        if resume_id is None:
+            return None
+
+        analysis_data = {
+            'resume_id': resume_id,
+            'ats_score': analysis['ats_score'],
+            'keyword_match_score': analysis['keyword_match']['score'],
+            'format_score': analysis['format_score'],
+            'section_score': analysis['section_score'],
+            'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
+            'recommendations': ','.join(analysis['suggestions'])
+        }
+        with self.metrics.time('db_write_seconds', table='resume_analysis'):
+            save_analysis_data(resume_id, analysis_data)
+        return resume_id
+
+    def collect_metrics(self):
+        """Jobs per status, as gauges for the metrics registry"""
+        counts = count_analysis_jobs()
+        return [('analysis_jobs', {'status': status}, counts.get(status, 0))
+                for status in ('queued', 'running', 'done', 'failed')]
+
+
+_analysis_job_queue = None
+_analysis_job_queue_lock = threading.Lock()
+
+
+def get_analysis_job_queue():
+    """Get the process-wide job queue (kept across Streamlit reruns), started on first use
+
+    Jobs left unfinished by an app process that has since exited are marked
+    failed, since their uploads were only held in memory, and old finished
+    jobs are pruned. Jobs of other running processes are left alone.
+    """
+    global _analysis_job_queue
+    with _analysis_job_queue_lock:
+        if _analysis_job_queue is None:
+            fail_interrupted_analysis_jobs(
+                [owner for owner in get_unfinished_analysis_job_owners() if _owner_exited(owner)]
+            )
+            delete_finished_analysis_jobs()
+            _analysis_job_queue = AnalysisJobQueue()
+            get_metrics().register_collector('analysis_jobs', _analysis_job_queue.collect_metrics)
+        return _analysis_job_queue
@@ -0,0 +1,290 @@
+"""
+Opt-in timing and profiling for resume analysis
+
+An Instrumentation object wraps one analysis at a time: every ``stage()``
+block and ``@timed`` function that runs inside it is timed, ``add_count()``
+records per-analysis counters, and the finished record goes to each sink.
+Outside an instrumented analysis these helpers are no-ops, so the analyzer
+pays nothing unless instrumentation is switched on. Histograms and counters
+live in a utils.metrics registry, which renders and writes the exposition.
+
+    analyzer.instrumentation = Instrumentation([MemorySink(), LoggingSink(slow_threshold=0.5)])
+    analyzer.instrumentation.profile_next()  # cProfile the next analysis
+"""
+import contextlib
+import cProfile
+import functools
+import heapq
+import io
+import itertools
+import logging
+import os
+import pstats
+import tempfile
+import threading
+import time
+from contextvars import ContextVar
+from datetime import datetime
+
+from .metrics import DEFAULT_BUCKETS, AnalysisMetricsSink, MetricsRegistry
+
+_current_timer = ContextVar('resume_analysis_timer', default=None)
+_NO_STAGE = contextlib.nullcontext()
+
+
+class _Stage:
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.timer.depth += 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        timer = self.timer
+        timer.depth -= 1
+        timer.stages[self.name] = timer.stages.get(self.name, 0.0) + elapsed
+        if timer.depth == 0:
+            timer.top_level += elapsed
+        return False
+
+
+class AnalysisTimer:
+    """Stage timings and counters of one analysis
+
+    Stages may nest (e.g. section segmentation inside education). Time not
+    covered by any top-level stage is reported as the ``other`` stage.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+        self.depth = 0
+        self.top_level = 0.0
+
+    def stage(self, name):
+        return _Stage(self, name)
+
+    def add_count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+
+def stage(name):
+    """Time a block as ``name`` when an instrumented analysis is running"""
+    timer = _current_timer.get()
+    return timer.stage(name) if timer is not None else _NO_STAGE
+
+
+def timed(name):
+    """Decorator form of stage()"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            timer = _current_timer.get()
+            if timer is None:
+                return func(*args, **kwargs)
+            with timer.stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def add_count(name, value=1):
+    """Add to a per-analysis counter when an instrumented analysis is running"""
+    timer = _current_timer.get()
+    if timer is not None:
+        timer.add_count(name, value)
+
+
+def is_active():
+    """True inside an instrumented analysis (guard for counters that cost something to compute)"""
+    return _current_timer.get() is not None
+
+
+class Instrumentation:
+    """Runs analyses under an AnalysisTimer and hands each record to the sinks
+
+    A record is a dict with ``label``, ``started_at``, ``total`` and
+    ``stages`` (seconds), ``counters``, ``error`` (message or None) and
+    ``profile`` (path of the profiler dump, or None).
+    """
+
+    def __init__(self, sinks=None, profile_dir=None, profiler='cprofile'):
+        self.sinks = list(sinks or [])
+        self.profile_dir = profile_dir or os.path.join(tempfile.gettempdir(), 'resume_analyzer_profiles')
+        self.profiler = profiler
+        self._profile_requests = 0
+        self._profile_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def add_sink(self, sink):
+        self.sinks.append(sink)
+
+    def profile_next(self, count=1):
+        """Profile the next ``count`` analyses and dump each result into profile_dir"""
+        with self._lock:
+            self._profile_requests += count
+
+    def _take_profile_request(self):
+        with self._lock:
+            if self._profile_requests <= 0:
+                return False
+            self._profile_requests -= 1
+            return True
+
+    def run(self, func, *args, label=''):
+        """Call ``func(*args)`` as one instrumented analysis and emit its record
+
+        A profiled analysis runs slower, so its stage times are inflated.
+        """
+        timer = AnalysisTimer()
+        token = _current_timer.set(timer)
+        record = {'label': label, 'started_at': datetime.now().isoformat(timespec='seconds'),
+                  'error': None, 'profile': None}
+        profiler = self._start_profiler() if self._take_profile_request() else None
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        except Exception as e:
+            record['error'] = str(e)
+            raise
+        finally:
+            total = time.perf_counter() - start
+            _current_timer.reset(token)
+            if profiler is not None:
+                record['profile'] = self._dump_profile(profiler)
+            record['total'] = total
+            record['stages'] = dict(timer.stages, other=max(0.0, total - timer.top_level))
+            record['counters'] = timer.counters
+            self._emit(record)
+
+    def _start_profiler(self):
+        if self.profiler == 'pyinstrument':
+            try:
+                from pyinstrument import Profiler
+            except ImportError:
+                raise ImportError("Sampling profiles require pyinstrument (pip install pyinstrument)")
+            profiler = Profiler()
+            profiler.start()
+            return profiler
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def _dump_profile(self, profiler):
+        """Stop the profiler and write its result into profile_dir, returning the path"""
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            path = os.path.join(self.profile_dir, f"analysis-{datetime.now():%Y%m%d-%H%M%S}-{next(self._profile_ids)}")
+            if isinstance(profiler, cProfile.Profile):
+                profiler.disable()
+                path += '.prof'
+                profiler.dump_stats(path)
+            else:
+                profiler.stop()
+                path += '.html'
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(profiler.output_html())
+            return path
+        except Exception as e:
+            print(f"Error writing analysis profile: {str(e)}")
+            return None
+
+    def _emit(self, record):
+        for sink in self.sinks:
+            try:
+                sink.emit(record)
+            except Exception as e:
+                print(f"Error emitting analysis timings: {str(e)}")
+
+
+def format_profile(path, sort='cumulative', limit=25):
+    """Render a cProfile dump as the usual pstats text table"""
+    stream = io.StringIO()
+    pstats.Stats(path, stream=stream).sort_stats(sort).print_stats(limit)
+    return stream.getvalue()
+
+
+class MemorySink(AnalysisMetricsSink):
+    """Records analyses into a metrics registry and keeps the slowest analyses in memory
+
+    Pass the app registry (``get_metrics()``) to share its series, or leave
+    ``registry`` out for a private one, e.g. in a benchmark.
+    """
+
+    def __init__(self, registry=None, buckets=DEFAULT_BUCKETS, keep_slowest=20):
+        super().__init__(registry or MetricsRegistry(buckets=buckets))
+        self.keep_slowest = keep_slowest
+        self.analyses = 0
+        self.errors = 0
+        self._slowest = []    # min-heap of (total, seq, record)
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        super().emit(record)
+        with self._lock:
+            self.analyses += 1
+            if record['error']:
+                self.errors += 1
+            entry = (record['total'], next(self._seq), record)
+            if len(self._slowest) < self.keep_slowest:
+                heapq.heappush(self._slowest, entry)
+            elif entry[0] > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def slowest(self):
+        """The slowest analyses seen, slowest first"""
+        with self._lock:
+            return [record for _, _, record in sorted(self._slowest, reverse=True)]
+
+    def quantile(self, name, q):
+        """Estimate the latency quantile of a stage, or of whole analyses for 'total'"""
+        if name == 'total':
+            return self.registry.quantile('analysis_seconds', q)
+        return self.registry.quantile('analysis_stage_seconds', q, stage=name)
+
+    def render_prometheus(self):
+        """Render the registry in the Prometheus text exposition format"""
+        return self.registry.render_prometheus()
+
+
+class PrometheusFileSink(MemorySink):
+    """MemorySink that rewrites a text exposition file after every analysis (e.g. for node_exporter's textfile collector)"""
+
+    def __init__(self, path, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+
+    def emit(self, record):
+        super().emit(record)
+        self.registry.write_exposition(self.path)
+
+
+class LoggingSink:
+    """Logs one line per analysis; analyses slower than ``slow_threshold`` seconds are logged as warnings"""
+
+    def __init__(self, logger=None, level=logging.INFO, slow_threshold=None):
+        self.logger = logger or logging.getLogger('resume_analyzer.timings')
+        self.level = level
+        self.slow_threshold = slow_threshold
+
+    def emit(self, record):
+        slow = self.slow_threshold is not None and record['total'] >= self.slow_threshold
+        level = logging.WARNING if slow or record['error'] else self.level
+        if not self.logger.isEnabledFor(level):
+            return
+        stages = ' '.join(
+            f'{name}={seconds * 1000:.1f}ms'
+            for name, seconds in sorted(record['stages'].items(), key=lambda item: -item[1])
+        )
+        counters = ' '.join(f'{name}={value}' for name, value in record['counters'].items())
+        message = f"analysis {record['label'] or '-'} total={record['total'] * 1000:.1f}ms {stages} {counters}"
+        if record['error']:
+            message += f" error={record['error']!r}"
+        if record['profile']:
+            message += f" profile={record['profile']}"
+        self.logger.log(level, message)
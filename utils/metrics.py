@@ -0,0 +1,311 @@
+"""
+Process-wide application metrics
+
+Counters and latency histograms live in one registry that survives
+Streamlit reruns. Each series also keeps a short rolling window (recent
+observations, per-minute counts) for the admin metrics page. The whole
+registry is rendered in the Prometheus text exposition format and written
+to a file that a local scraper (or node_exporter's textfile collector) can read.
+
+Analysis timings from utils.instrumentation are recorded here too (see
+AnalysisMetricsSink), so the app exports one metric family under one prefix.
+"""
+import bisect
+import os
+import threading
+import time
+from collections import deque
+
+METRIC_PREFIX = 'resume_app'
+# Upper bounds (seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+METRICS_EXPOSITION_PATH = os.path.join('metrics', 'resume_app.prom')
+# Seconds between rewrites of the exposition file
+EXPOSITION_INTERVAL = 15
+# Observations per histogram series kept for the recent percentiles
+RECENT_WINDOW = 1024
+# Minutes of per-minute counts kept by every counter
+ROLLING_MINUTES = 60
+
+
+def _label_key(labels):
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(label_key, extra=()):
+    pairs = list(label_key) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (
+        (name, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for name, value in pairs
+    )
+    return '{' + ','.join(f'{name}="{value}"' for name, value in escaped) + '}'
+
+
+class _Counter:
+    def __init__(self):
+        self.value = 0
+        self.minutes = deque(maxlen=ROLLING_MINUTES)  # [minute, count]
+
+    def add(self, amount, now):
+        self.value += amount
+        minute = int(now // 60)
+        if self.minutes and self.minutes[-1][0] == minute:
+            self.minutes[-1][1] += amount
+        else:
+            self.minutes.append([minute, amount])
+
+    def recent(self, minutes, now):
+        oldest = int(now // 60) - minutes + 1
+        return sum(count for minute, count in self.minutes if minute >= oldest)
+
+
+class _Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.recent = deque(maxlen=RECENT_WINDOW)
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.recent.append(value)
+
+    def recent_percentiles(self, percentiles=(50, 95, 99)):
+        values = sorted(self.recent)
+        if not values:
+            return {pct: None for pct in percentiles}
+        return {pct: values[min(len(values) - 1, len(values) * pct // 100)] for pct in percentiles}
+
+
+class MetricsRegistry:
+    """Labelled counters and histograms, plus collectors polled at render time
+
+    Collectors are callables returning ``[(name, labels, value)]`` gauges,
+    used for figures that already live elsewhere such as cache hit rates.
+    """
+
+    def __init__(self, prefix=METRIC_PREFIX, buckets=DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = tuple(sorted(buckets))
+        self.started_at = time.time()
+        self._counters = {}    # name -> {label_key: _Counter}
+        self._histograms = {}  # name -> {label_key: _Histogram}
+        self._help = {}
+        self._collectors = {}
+        self._lock = threading.Lock()
+        self._writer = None
+
+    def describe(self, name, help_text):
+        self._help[name] = help_text
+
+    def inc(self, name, amount=1, **labels):
+        """Add to a counter"""
+        now = time.time()
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            counter = series.get(_label_key(labels))
+            if counter is None:
+                counter = series[_label_key(labels)] = _Counter()
+            counter.add(amount, now)
+
+    def observe(self, name, seconds, **labels):
+        """Record one latency observation in a histogram"""
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(_label_key(labels))
+            if histogram is None:
+                histogram = series[_label_key(labels)] = _Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def quantile(self, name, q, **labels):
+        """Estimate a histogram's quantile (seconds) from its bucket bounds"""
+        with self._lock:
+            histogram = self._histograms.get(name, {}).get(_label_key(labels))
+            if histogram is None:
+                return None
+            target = q * histogram.count
+            running = 0
+            for index, bucket_count in enumerate(histogram.counts):
+                running += bucket_count
+                if running >= target and bucket_count:
+                    return self.buckets[index] if index < len(self.buckets) else float('inf')
+            return None
+
+    def time(self, name, **labels):
+        """Context manager observing the duration of its block"""
+        return _Timer(self, name, labels)
+
+    def register_collector(self, name, collector):
+        """Add (or replace) a gauge collector under ``name``"""
+        with self._lock:
+            self._collectors[name] = collector
+
+    def _collect_gauges(self):
+        with self._lock:
+            collectors = list(self._collectors.items())
+        gauges = []
+        for collector_name, collector in collectors:
+            try:
+                gauges.extend(collector())
+            except Exception as e:
+                print(f"Error collecting {collector_name} metrics: {str(e)}")
+        return gauges
+
+    def snapshot(self, window_minutes=(5, 60)):
+        """Plain-dict view of every series for display"""
+        now = time.time()
+        with self._lock:
+            counters = [
+                {
+                    'name': name, 'labels': dict(label_key), 'total': counter.value,
+                    **{f'last_{minutes}m': counter.recent(minutes, now) for minutes in window_minutes}
+                }
+                for name, series in sorted(self._counters.items())
+                for label_key, counter in sorted(series.items())
+            ]
+            histograms = []
+            for name, series in sorted(self._histograms.items()):
+                for label_key, histogram in sorted(series.items()):
+                    recent = histogram.recent_percentiles()
+                    histograms.append({
+                        'name': name, 'labels': dict(label_key), 'count': histogram.count,
+                        'mean': histogram.sum / histogram.count if histogram.count else None,
+                        'p50': recent[50], 'p95': recent[95], 'p99': recent[99],
+                    })
+        gauges = [
+            {'name': name, 'labels': labels, 'value': value}
+            for name, labels, value in self._collect_gauges()
+        ]
+        return {'uptime': now - self.started_at, 'counters': counters, 'histograms': histograms, 'gauges': gauges}
+
+    def render_prometheus(self):
+        """Render every series in the Prometheus text exposition format"""
+        prefix = self.prefix
+        lines = [
+            f'# TYPE {prefix}_uptime_seconds gauge',
+            f'{prefix}_uptime_seconds {time.time() - self.started_at:.0f}',
+        ]
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                if name in self._help:
+                    lines.append(f'# HELP {prefix}_{name} {self._help[name]}')
+                lines.append(f'# TYPE {prefix}_{name} counter')
+                for label_key, counter in sorted(series.items()):
+                    lines.append(f'{prefix}_{name}{_format_labels(label_key)} {counter.value}')
+            for name, series in sorted(self._histograms.items()):
+                if name in self._help:
+                    lines.append(f'# HELP {prefix}_{name} {self._help[name]}')
+                lines.append(f'# TYPE {prefix}_{name} histogram')
+                for label_key, histogram in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(self.buckets + ('+Inf',), histogram.counts):
+                        cumulative += count
+                        lines.append(f'{prefix}_{name}_bucket{_format_labels(label_key, [("le", str(bound))])} {cumulative}')
+                    lines.append(f'{prefix}_{name}_sum{_format_labels(label_key)} {histogram.sum:.6f}')
+                    lines.append(f'{prefix}_{name}_count{_format_labels(label_key)} {histogram.count}')
+        typed = set()
+        for name, labels, value in self._collect_gauges():
+            if name not in typed:
+                typed.add(name)
+                lines.append(f'# TYPE {prefix}_{name} gauge')
+            lines.append(f'{prefix}_{name}{_format_labels(_label_key(labels))} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def write_exposition(self, path=METRICS_EXPOSITION_PATH):
+        """Atomically (re)write the exposition file"""
+        try:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.render_prometheus())
+            os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            print(f"Error writing metrics exposition: {str(e)}")
+            return False
+
+    def start_exposition_writer(self, path=METRICS_EXPOSITION_PATH, interval=EXPOSITION_INTERVAL):
+        """Rewrite the exposition file every ``interval`` seconds from a daemon thread (once per process)"""
+        with self._lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(
+                target=self._write_loop, args=(path, interval), name='metrics-exposition', daemon=True
+            )
+        self._writer.start()
+
+    def _write_loop(self, path, interval):
+        while True:
+            self.write_exposition(path)
+            time.sleep(interval)
+
+
+class _Timer:
+    def __init__(self, registry, name, labels):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.elapsed = time.perf_counter() - self.start
+        self.registry.observe(self.name, self.elapsed, **self.labels)
+        return False
+
+
+class AnalysisMetricsSink:
+    """Instrumentation sink that feeds analysis timings and counters into a registry"""
+
+    def __init__(self, registry):
+        self.registry = registry
+
+    def emit(self, record):
+        self.registry.observe('analysis_seconds', record['total'])
+        for stage, seconds in record['stages'].items():
+            self.registry.observe('analysis_stage_seconds', seconds, stage=stage)
+        for name, value in record['counters'].items():
+            self.registry.inc(f'analysis_{name}_total', value)
+        if record['error']:
+            self.registry.inc('analysis_errors_total')
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_metrics():
+    """Get the process-wide metrics registry (kept across Streamlit reruns)"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = MetricsRegistry()
+            for name, help_text in METRIC_HELP.items():
+                _registry.describe(name, help_text)
+        return _registry
+
+
+METRIC_HELP = {
+    'uploads_analyzed_total': 'Resume uploads analyzed, by file type and whether the analysis cache answered',
+    'extraction_seconds': 'Text extraction time by file type',
+    'analysis_seconds': 'analyze_resume time',
+    'analysis_stage_seconds': 'analyze_resume time per stage',
+    'analysis_errors_total': 'Analyses that raised',
+    'analysis_text_chars_total': 'Characters of resume text analyzed',
+    'analysis_lines_total': 'Lines of resume text analyzed',
+    'analysis_skills_required_total': 'Required skills checked against resumes',
+    'analysis_skills_matched_total': 'Required skills found in resumes',
+    'db_write_seconds': 'Time to save resume and analysis rows',
+    'dashboard_query_seconds': 'Dashboard query time per DashboardManager method (cache misses only)',
+    'dashboard_queries_total': 'Dashboard query lookups per method and cache result',
+    'resumes_generated_total': 'Resumes generated by the builder, by template',
+    'resume_generation_seconds': 'Resume builder time by template',
+}
@@ -0,0 +1,56 @@
+"""
+Compiled regular expressions shared by the resume heuristics
+
+Each pattern is compiled once at import. Checks stay as separate patterns
+rather than one alternation with named groups: a lone pattern keeps re's
+literal-prefix search (e.g. for ``github.com/``) and ``any()`` stops at the
+first hit, while a combined scan has to walk the whole text whenever one
+field is missing (see benchmarks/bench_regex.py).
+"""
+import re
+
+# First match of each is taken as the contact detail
+CONTACT_PATTERNS = {
+    'email': re.compile(r'[\w\.-]+@[\w\.-]+\.\w+'),
+    'phone': re.compile(r'(?:\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}'),
+    'linkedin': re.compile(r'linkedin\.com/in/[\w-]+'),
+    'github': re.compile(r'github\.com/[\w-]+'),
+}
+
+# Any well-formed contact detail, for the formatting check
+FORMATTED_CONTACT_PATTERN = re.compile(
+    r'\b[\w\.-]+@[\w\.-]+\.\w+\b'     # email
+    r'|\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'  # phone
+    r'|linkedin\.com/\w+'              # LinkedIn
+)
+
+# Contact words that rule out the opening lines as a summary
+CONTACT_WORD_PATTERN = re.compile(r'\b(?:email|phone|address|tel|mobile|linkedin)\b', re.IGNORECASE)
+
+YEAR_PATTERN = re.compile(r'\b(?:19|20)\d{2}\b')
+
+EXPERIENCE_CHECKS = {
+    'date': YEAR_PATTERN,
+    'bullet': re.compile(r'[•\-\*]'),
+    'action_verb': re.compile(r'\b(?:developed|managed|created|implemented|designed|led|improved)\b', re.IGNORECASE),
+}
+
+EDUCATION_CHECKS = {
+    'date': YEAR_PATTERN,
+    'degree': re.compile(r'\b(?:bachelor|master|phd|b\.|m\.|diploma)\b', re.IGNORECASE),
+    'gpa': re.compile(r'\b(?:gpa|cgpa|grade|percentage)\b', re.IGNORECASE),
+}
+
+
+def find_contacts(text):
+    """Return the first email, phone, LinkedIn and GitHub match ('' when absent)"""
+    contacts = {}
+    for field, pattern in CONTACT_PATTERNS.items():
+        match = pattern.search(text)
+        contacts[field] = match.group(0) if match else ''
+    return contacts
+
+
+def passing_checks(checks, entries):
+    """Return the names of the checks whose pattern matches at least one entry"""
+    return {name for name, pattern in checks.items() if any(pattern.search(entry) for entry in entries)}
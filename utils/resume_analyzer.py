@@ -1,7 +1,20 @@
-import re
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from .instrumentation import add_count, is_active, stage, timed
+from .patterns import (
+    CONTACT_WORD_PATTERN, EDUCATION_CHECKS, EXPERIENCE_CHECKS, FORMATTED_CONTACT_PATTERN,
+    find_contacts, passing_checks
+)
+from .role_ranker import get_role_ranker
+from .section_segmenter import SECTION_KEYWORDS, segment_sections
+from .skill_matcher import get_skill_matcher
+from .text_extraction import EXTRACTORS, extract_text, read_bytes
 
 class ResumeAnalyzer:
-    def __init__(self):
+    def __init__(self, instrumentation=None):
+        # Optional utils.instrumentation.Instrumentation; None keeps analysis untimed
+        self.instrumentation = instrumentation
+
         # Document type indicators
         self.document_types = {
             'resume': [
@@ -40,28 +53,12 @@ class ResumeAnalyzer:
         return best_match[0] if best_match[1] > 0.15 else 'unknown'
         
     def calculate_keyword_match(self, resume_text, required_skills):
-        resume_text = resume_text.lower()
-        found_skills = []
-        missing_skills = []
-        
-        for skill in required_skills:
-            skill_lower = skill.lower()
-            # Check for exact match
-            if skill_lower in resume_text:
-                found_skills.append(skill)
-            # Check for partial matches (e.g., "Python" in "Python programming")
-            elif any(skill_lower in phrase for phrase in resume_text.split('.')):
-                found_skills.append(skill)
-            else:
-                missing_skills.append(skill)
-                
-        match_score = (len(found_skills) / len(required_skills)) * 100 if required_skills else 0
-        
-        return {
-            'score': match_score,
-            'found_skills': found_skills,
-            'missing_skills': missing_skills
-        }
+        # Matchers are compiled once per skill list and reused across resumes
+        return get_skill_matcher(required_skills).match(resume_text)
+
+    def rank_roles(self, resume_text, top_k=5):
+        """Rank every catalog role against the resume's skills, best matches first"""
+        return get_role_ranker().rank(resume_text, top_k=top_k)
         
     def check_resume_sections(self, text):
         text = text.lower()
@@ -106,277 +103,92 @@ class ResumeAnalyzer:
             deductions.append("Inconsistent spacing between sections")
             
         # Check for contact information format
-        contact_patterns = [
-            r'\b[\w\.-]+@[\w\.-]+\.\w+\b',  # email
-            r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',  # phone
-            r'linkedin\.com/\w+',  # LinkedIn
-        ]
-        if not any(re.search(pattern, text) for pattern in contact_patterns):
+        if not FORMATTED_CONTACT_PATTERN.search(text):
             score -= 15
             deductions.append("Missing or improperly formatted contact information")
             
         return max(0, score), deductions
         
-    def extract_text_from_pdf(self, file):
+    def extract_text(self, file, filename=None, mime=None, **options):
+        """Extract text from any supported upload (PDF, DOCX, TXT, RTF, ODT)"""
         try:
-            import PyPDF2
-            import io
-            
-            # Create a PDF reader object
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(file.read()))
-            
-            # Extract text from all pages
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-                
-            return text
+            return extract_text(file, filename=filename, mime=mime, **options)
+        except Exception as e:
+            raise Exception(f"Error extracting text from file: {str(e)}")
+
+    def extract_text_from_pdf(self, file, max_pages=None, workers=None):
+        """Extract text from a PDF file, optionally stopping after max_pages"""
+        try:
+            return EXTRACTORS['pdf'](read_bytes(file), max_pages=max_pages, workers=workers)
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
             
     def extract_text_from_docx(self, docx_file):
         """Extract text from a DOCX file"""
         try:
-            from docx import Document
-            doc = Document(docx_file)
-            full_text = []
-            for paragraph in doc.paragraphs:
-                full_text.append(paragraph.text)
-            return '\n'.join(full_text)
+            return EXTRACTORS['docx'](read_bytes(docx_file))
         except Exception as e:
             raise Exception(f"Error extracting text from DOCX file: {str(e)}")
 
+    def extract_text_from_source(self, source):
+        """Extract text from a file path or raw bytes, detecting the format from the content"""
+        return self.extract_text(source)
+
     def extract_personal_info(self, text):
         """Extract personal information from resume text"""
-        # Basic patterns for personal info
-        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-        phone_pattern = r'(\+\d{1,3}[-.]?)?\s*\(?\d{3}\)?[-.]?\s*\d{3}[-.]?\s*\d{4}'
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        github_pattern = r'github\.com/[\w-]+'
-        
-        # Extract information
-        email = re.search(email_pattern, text)
-        phone = re.search(phone_pattern, text)
-        linkedin = re.search(linkedin_pattern, text)
-        github = re.search(github_pattern, text)
+        # Email, phone, LinkedIn and GitHub from the precompiled pattern bank
+        contacts = find_contacts(text)
         
         # Get the first line as name (basic assumption)
         name = text.split('\n')[0].strip()
         
         return {
             'name': name if len(name) > 0 else 'Unknown',
-            'email': email.group(0) if email else '',
-            'phone': phone.group(0) if phone else '',
-            'linkedin': linkedin.group(0) if linkedin else '',
-            'github': github.group(0) if github else '',
+            'email': contacts['email'],
+            'phone': contacts['phone'],
+            'linkedin': contacts['linkedin'],
+            'github': contacts['github'],
             'portfolio': ''  # Can be enhanced later
         }
 
+    @timed('segment_sections')
+    def get_sections(self, text):
+        """Segment the resume into section blocks (cached per text)"""
+        return segment_sections(text, tuple(self.document_types['resume']))
+
     def extract_education(self, text):
         """Extract education information from resume text"""
-        education = []
-        lines = text.split('\n')
-        education_keywords = [
-            'education', 'academic', 'qualification', 'degree', 'university', 'college',
-            'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
-            'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc','bca', 'mca', 'b.com',
-            'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
-        ]
-        in_education_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in education_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in education_keywords):
-                    # This line contains education info, not just a header
-                    current_entry.append(line)
-                in_education_section = True
-                continue
-            
-            if in_education_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(edu_key.lower() in line.lower() for edu_key in education_keywords):
-                        in_education_section = False
-                        if current_entry:
-                            education.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    education.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            education.append(' '.join(current_entry))
-        
-        return education
+        return [' '.join(block) for block in self.get_sections(text)['education']]
 
     def extract_experience(self, text):
         """Extract work experience information from resume text"""
-        experience = []
-        lines = text.split('\n')
-        experience_keywords = [
-            'experience', 'employment', 'work history', 'professional experience',
-            'work experience', 'career history', 'professional background',
-            'employment history', 'job history', 'positions held', 'experience',
-            'job title', 'job responsibilities', 'job description', 'job summary'
-        ]
-        in_experience_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in experience_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in experience_keywords):
-                    # This line contains experience info, not just a header
-                    current_entry.append(line)
-                in_experience_section = True
-                continue
-            
-            if in_experience_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(exp_key.lower() in line.lower() for exp_key in experience_keywords):
-                        in_experience_section = False
-                        if current_entry:
-                            experience.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    experience.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            experience.append(' '.join(current_entry))
-        
-        return experience
+        return [' '.join(block) for block in self.get_sections(text)['experience']]
 
     def extract_projects(self, text):
         """Extract project information from resume text"""
-        projects = []
-        lines = text.split('\n')
-        project_keywords = [
-            'projects', 'personal projects', 'academic projects', 'key projects',
-            'major projects', 'professional projects', 'project experience',
-            'relevant projects', 'featured projects','latest projects',
-            'top projects'
-        ]
-        in_project_section = False
-        current_entry = []
-
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in project_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in project_keywords):
-                    # This line contains project info, not just a header
-                    current_entry.append(line)
-                in_project_section = True
-                continue
-            
-            if in_project_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(proj_key.lower() in line.lower() for proj_key in project_keywords):
-                        in_project_section = False
-                        if current_entry:
-                            projects.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    projects.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            projects.append(' '.join(current_entry))
-        
-        return projects
+        return [' '.join(block) for block in self.get_sections(text)['projects']]
 
     def extract_skills(self, text):
         """Extract skills from resume text"""
         skills = set()  # Use set to avoid duplicates
-        lines = text.split('\n')
-        skills_keywords = [
-            'skills', 'technical skills', 'competencies', 'expertise',
-            'core competencies', 'professional skills', 'key skills',
-            'technical expertise', 'proficiencies', 'qualifications',
-            'top skills', 'key skill', 'major skill', 'personal skill',
-            'soft skills', 'soft skill', 'soft skillset'
-        ]
-        in_skills_section = False
-        current_entry = []
 
         # Common skill separators
         separators = [',', '•', '|', '/', '\\', '·', '>', '-', '–', '―']
 
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in skills_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in skills_keywords):
-                    # This line contains skills, not just a header
-                    current_entry.append(line)
-                in_skills_section = True
-                continue
-            
-            if in_skills_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(skill_key.lower() in line.lower() for skill_key in skills_keywords):
-                        in_skills_section = False
-                        if current_entry:
-                            # Process the current entry
-                            text_to_process = ' '.join(current_entry)
-                            # Split by common separators
-                            for separator in separators:
-                                if separator in text_to_process:
-                                    skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    # Process the current entry
-                    text_to_process = ' '.join(current_entry)
-                    # Split by common separators
-                    for separator in separators:
-                        if separator in text_to_process:
-                            skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-                    current_entry = []
-        
-        if current_entry:
-            # Process any remaining skills
-            text_to_process = ' '.join(current_entry)
+        for block in self.get_sections(text)['skills']:
+            text_to_process = ' '.join(block)
+            # Split by common separators
             for separator in separators:
                 if separator in text_to_process:
                     skills.update(skill.strip() for skill in text_to_process.split(separator) if skill.strip())
-        
+
         return list(skills)
 
     def extract_summary(self, text):
         """Extract summary/objective from resume text"""
         summary = []
         lines = text.split('\n')
-        summary_keywords = [
-            'summary', 'professional summary', 'career summary', 'objective',
-            'career objective', 'professional objective', 'about me', 'profile',
-            'professional profile', 'career profile', 'overview', 'skill summary'
-        ]
-        in_summary_section = False
-        current_entry = []
+        summary_keywords = SECTION_KEYWORDS['summary']
 
         # Try to find summary at the beginning of the resume
         start_index = 0
@@ -397,50 +209,38 @@ class ResumeAnalyzer:
         if first_lines and not any(keyword in first_lines[0].lower() for keyword in summary_keywords):
             potential_summary = ' '.join(first_lines)
             if len(potential_summary.split()) > 10:  # More than 10 words
-                if not re.search(r'\b(?:email|phone|address|tel|mobile|linkedin)\b', potential_summary.lower()):
+                if not CONTACT_WORD_PATTERN.search(potential_summary):
                     summary.append(potential_summary)
 
-        # Look for explicitly marked summary section
-        for line in lines:
-            line = line.strip()
-            # Check for section header
-            if any(keyword.lower() in line.lower() for keyword in summary_keywords):
-                if not any(keyword.lower() == line.lower() for keyword in summary_keywords):
-                    # This line contains summary info, not just a header
-                    current_entry.append(line)
-                in_summary_section = True
-                continue
-            
-            if in_summary_section:
-                # Check if we've hit another section
-                if line and any(keyword.lower() in line.lower() for keyword in self.document_types['resume']):
-                    if not any(sum_key.lower() in line.lower() for sum_key in summary_keywords):
-                        in_summary_section = False
-                        if current_entry:
-                            summary.append(' '.join(current_entry))
-                            current_entry = []
-                        continue
-                
-                if line:
-                    current_entry.append(line)
-                elif current_entry:  # Empty line and we have content
-                    summary.append(' '.join(current_entry))
-                    current_entry = []
-        
-        if current_entry:
-            summary.append(' '.join(current_entry))
-        
+        # Add the explicitly marked summary section
+        summary.extend(' '.join(block) for block in self.get_sections(text)['summary'])
+
         return ' '.join(summary) if summary else ''
 
     def analyze_resume(self, resume_data, job_requirements):
-        """Analyze resume and return scores and recommendations"""
+        """Analyze resume and return scores and recommendations
+
+        With instrumentation set, each stage is timed and the record is sent
+        to its sinks, labelled with ``resume_data['filename']`` when given.
+        """
+        if self.instrumentation is not None:
+            return self.instrumentation.run(self._analyze_resume, resume_data, job_requirements,
+                                            label=resume_data.get('filename', ''))
+        return self._analyze_resume(resume_data, job_requirements)
+
+    def _analyze_resume(self, resume_data, job_requirements):
         text = resume_data.get('raw_text', '')
+        if is_active():
+            add_count('text_chars', len(text))
+            add_count('lines', text.count('\n') + 1)
         
         # Extract personal information
-        personal_info = self.extract_personal_info(text)
+        with stage('personal_info'):
+            personal_info = self.extract_personal_info(text)
         
         # First detect document type
-        doc_type = self.detect_document_type(text)
+        with stage('document_type'):
+            doc_type = self.detect_document_type(text)
         if doc_type != 'resume':
             return {
                 'ats_score': 0,
@@ -453,20 +253,30 @@ class ResumeAnalyzer:
             
         # Calculate keyword match
         required_skills = job_requirements.get('required_skills', [])
-        keyword_match = self.calculate_keyword_match(text, required_skills)
+        with stage('keyword_match'):
+            keyword_match = self.calculate_keyword_match(text, required_skills)
+        add_count('skills_required', len(required_skills))
+        add_count('skills_matched', len(keyword_match['found_skills']))
         
         # Extract all resume sections
-        education = self.extract_education(text)
-        experience = self.extract_experience(text)
-        projects = self.extract_projects(text)
-        skills = list(self.extract_skills(text))  # Convert skills set to list
-        summary = self.extract_summary(text)
+        with stage('education'):
+            education = self.extract_education(text)
+        with stage('experience'):
+            experience = self.extract_experience(text)
+        with stage('projects'):
+            projects = self.extract_projects(text)
+        with stage('skills'):
+            skills = list(self.extract_skills(text))  # Convert skills set to list
+        with stage('summary'):
+            summary = self.extract_summary(text)
         
         # Check resume sections
-        section_score = self.check_resume_sections(text)
+        with stage('section_check'):
+            section_score = self.check_resume_sections(text)
         
         # Check formatting
-        format_score, format_deductions = self.check_formatting(text)
+        with stage('formatting'):
+            format_score, format_deductions = self.check_formatting(text)
         
         # Generate section-specific suggestions
         contact_suggestions = []
@@ -497,10 +307,10 @@ class ResumeAnalyzer:
         if not experience:
             experience_suggestions.append("Add your work experience section")
         else:
-            has_dates = any(re.search(r'\b(19|20)\d{2}\b', exp) for exp in experience)
-            has_bullets = any(re.search(r'[•\-\*]', exp) for exp in experience)
-            has_action_verbs = any(re.search(r'\b(developed|managed|created|implemented|designed|led|improved)\b', 
-                                           exp.lower()) for exp in experience)
+            found = passing_checks(EXPERIENCE_CHECKS, experience)
+            has_dates = 'date' in found
+            has_bullets = 'bullet' in found
+            has_action_verbs = 'action_verb' in found
             
             if not has_dates:
                 experience_suggestions.append("Include dates for each work experience")
@@ -513,11 +323,10 @@ class ResumeAnalyzer:
         if not education:
             education_suggestions.append("Add your educational background")
         else:
-            has_dates = any(re.search(r'\b(19|20)\d{2}\b', edu) for edu in education)
-            has_degree = any(re.search(r'\b(bachelor|master|phd|b\.|m\.|diploma)\b', 
-                                     edu.lower()) for edu in education)
-            has_gpa = any(re.search(r'\b(gpa|cgpa|grade|percentage)\b', 
-                                  edu.lower()) for edu in education)
+            found = passing_checks(EDUCATION_CHECKS, education)
+            has_dates = 'date' in found
+            has_degree = 'degree' in found
+            has_gpa = 'gpa' in found
             
             if not has_dates:
                 education_suggestions.append("Include graduation dates")
@@ -587,3 +396,63 @@ class ResumeAnalyzer:
                 'format': format_score
             }
         }
+
+    def analyze_batch(self, paths_or_bytes, job_requirements, workers=None, ordered=False):
+        """Analyze many resumes across a process pool, yielding (index, analysis) pairs
+
+        Results are yielded as they finish, or in input order when ``ordered`` is set.
+        A resume that fails to extract or analyze yields ``{'error': message}``.
+        """
+        workers = workers or os.cpu_count() or 1
+        sources = enumerate(paths_or_bytes)
+
+        if workers == 1:
+            for index, source in sources:
+                yield index, _analyze_source(source, job_requirements)
+            return
+
+        # Bound the work in flight so large batches stream instead of queuing everything.
+        # In ordered mode, results held back behind a slow resume count towards the bound.
+        max_in_flight = workers * 4
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = {}
+            finished = {}
+            next_index = 0
+
+            def fill():
+                while len(pending) + len(finished) < max_in_flight:
+                    for index, source in sources:
+                        pending[executor.submit(_analyze_source, source, job_requirements)] = index
+                        break
+                    else:
+                        return
+
+            fill()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    if not ordered:
+                        yield index, future.result()
+                        continue
+                    finished[index] = future.result()
+                    while next_index in finished:
+                        yield next_index, finished.pop(next_index)
+                        next_index += 1
+                fill()
+
+
+_worker_analyzer = None
+
+
+def _analyze_source(source, job_requirements):
+    """Worker entry point for analyze_batch; reuses one analyzer per process"""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = ResumeAnalyzer()
+
+    try:
+        text = _worker_analyzer.extract_text_from_source(source)
+        return _worker_analyzer.analyze_resume({'raw_text': text}, job_requirements)
+    except Exception as e:
+        return {'error': str(e)}
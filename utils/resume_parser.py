@@ -1,43 +1,30 @@
-import PyPDF2
-import docx
 import re
-from io import BytesIO
+from .text_extraction import EXTRACTORS, extract_text, read_bytes
 
 class ResumeParser:
     def __init__(self):
         pass
         
-    def extract_text_from_pdf(self, pdf_file):
+    def extract_text_from_pdf(self, pdf_file, max_pages=None, workers=None):
         try:
-            pdf_reader = PyPDF2.PdfReader(BytesIO(pdf_file.read()))
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            return EXTRACTORS['pdf'](read_bytes(pdf_file), max_pages=max_pages, workers=workers).strip()
         except Exception as e:
             print(f"Error extracting text from PDF: {e}")
             return ""
             
     def extract_text_from_docx(self, docx_file):
         try:
-            doc = docx.Document(BytesIO(docx_file.read()))
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return EXTRACTORS['docx'](read_bytes(docx_file)).strip()
         except Exception as e:
             print(f"Error extracting text from DOCX: {e}")
             return ""
             
     def extract_text(self, file):
-        file_content = file.read()
-        file.seek(0)  # Reset file pointer
-        
-        if file.name.endswith('.pdf'):
-            return self.extract_text_from_pdf(file)
-        elif file.name.endswith('.docx'):
-            return self.extract_text_from_docx(file)
-        else:
+        # One read of the upload; the format comes from its content, MIME type or name
+        try:
+            return extract_text(file, filename=getattr(file, 'name', None), mime=getattr(file, 'type', None)).strip()
+        except Exception as e:
+            print(f"Error extracting text: {e}")
             return ""
             
     def parse(self, file):
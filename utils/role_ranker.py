@@ -0,0 +1,58 @@
+from functools import lru_cache
+
+from config.role_catalog import get_role_catalog
+from .skill_matcher import SkillMatcher
+
+
+class RoleRanker:
+    """Score one resume against every role with a single skill scan
+
+    All catalog skills go into one SkillMatcher. The catalog's inverted
+    skill -> roles index then turns the skills found in the resume into
+    per-role hit counts, so the cost grows with the skills found rather
+    than with the number of roles.
+    """
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.matcher = SkillMatcher(catalog.skills)
+
+    def rank(self, resume_text, top_k=5):
+        """Return the top_k roles by share of required skills found in the resume"""
+        catalog = self.catalog
+        found_ids = {
+            catalog.skill_id_by_key[key] for key in self.matcher.find(resume_text)
+            if key in catalog.skill_id_by_key
+        }
+
+        hits = {}
+        roles_by_skill = catalog.roles_by_skill
+        for skill_id in found_ids:
+            for role_id in roles_by_skill[skill_id]:
+                hits[role_id] = hits.get(role_id, 0) + 1
+
+        scored = sorted(
+            (
+                (count / (catalog.skill_offsets[role_id + 1] - catalog.skill_offsets[role_id]) * 100, count, role_id)
+                for role_id, count in hits.items()
+            ),
+            key=lambda item: (-item[0], -item[1], item[2])
+        )
+
+        matches = []
+        for score, _, role_id in scored[:top_k]:
+            skill_ids = catalog.role_skill_ids(role_id)
+            matches.append({
+                'category': catalog.categories[catalog.role_categories[role_id]],
+                'role': catalog.role_names[role_id],
+                'score': round(score, 1),
+                'found_skills': [catalog.skills[skill_id] for skill_id in skill_ids if skill_id in found_ids],
+                'missing_skills': [catalog.skills[skill_id] for skill_id in skill_ids if skill_id not in found_ids]
+            })
+        return matches
+
+
+@lru_cache(maxsize=1)
+def get_role_ranker():
+    """Get the ranker over JOB_ROLES and the master catalog, built on first use"""
+    return RoleRanker(get_role_catalog())
@@ -0,0 +1,112 @@
+import re
+from functools import lru_cache
+
+# Keywords that open (or belong to) each resume section
+SECTION_KEYWORDS = {
+    'education': (
+        'education', 'academic', 'qualification', 'degree', 'university', 'college',
+        'school', 'institute', 'certification', 'diploma', 'bachelor', 'master',
+        'phd', 'b.tech', 'm.tech', 'b.e', 'm.e', 'b.sc', 'm.sc', 'bca', 'mca', 'b.com',
+        'm.com', 'b.cs-it', 'imca', 'bba', 'mba', 'honors', 'scholarship'
+    ),
+    'experience': (
+        'experience', 'employment', 'work history', 'professional experience',
+        'work experience', 'career history', 'professional background',
+        'employment history', 'job history', 'positions held',
+        'job title', 'job responsibilities', 'job description', 'job summary'
+    ),
+    'projects': (
+        'projects', 'personal projects', 'academic projects', 'key projects',
+        'major projects', 'professional projects', 'project experience',
+        'relevant projects', 'featured projects', 'latest projects',
+        'top projects'
+    ),
+    'skills': (
+        'skills', 'technical skills', 'competencies', 'expertise',
+        'core competencies', 'professional skills', 'key skills',
+        'technical expertise', 'proficiencies', 'qualifications',
+        'top skills', 'key skill', 'major skill', 'personal skill',
+        'soft skills', 'soft skill', 'soft skillset'
+    ),
+    'summary': (
+        'summary', 'professional summary', 'career summary', 'objective',
+        'career objective', 'professional objective', 'about me', 'profile',
+        'professional profile', 'career profile', 'overview', 'skill summary'
+    ),
+}
+
+
+def _keyword_pattern(keywords):
+    """Compile a substring search for any of the keywords"""
+    return re.compile('|'.join(re.escape(keyword.lower()) for keyword in keywords))
+
+
+class SectionSegmenter:
+    """Split resume text into per-section blocks in a single pass over its lines"""
+
+    def __init__(self, boundary_keywords, section_keywords=SECTION_KEYWORDS):
+        self.sections = tuple(section_keywords)
+        self.section_patterns = {
+            section: _keyword_pattern(keywords) for section, keywords in section_keywords.items()
+        }
+        self.section_headers = {
+            section: frozenset(keyword.lower() for keyword in keywords)
+            for section, keywords in section_keywords.items()
+        }
+        # Any of these on a line ends the section that is currently open
+        self.boundary_pattern = _keyword_pattern(boundary_keywords)
+
+    def segment(self, text):
+        """Return a section -> blocks map, where each block is a tuple of lines"""
+        blocks = {section: [] for section in self.sections}
+        current = {section: [] for section in self.sections}
+        in_section = dict.fromkeys(self.sections, False)
+
+        for line in text.split('\n'):
+            line = line.strip()
+            line_lower = line.lower()
+            hits_boundary = None
+
+            for section in self.sections:
+                # A line mentioning the section's keywords opens it
+                if self.section_patterns[section].search(line_lower):
+                    if line_lower not in self.section_headers[section]:
+                        # This line carries content, not just a header
+                        current[section].append(line)
+                    in_section[section] = True
+                    continue
+
+                if not in_section[section]:
+                    continue
+
+                if line:
+                    if hits_boundary is None:
+                        hits_boundary = bool(self.boundary_pattern.search(line_lower))
+                    if hits_boundary:
+                        # Another section has started
+                        in_section[section] = False
+                        if current[section]:
+                            blocks[section].append(tuple(current[section]))
+                            current[section] = []
+                        continue
+                    current[section].append(line)
+                elif current[section]:  # Empty line and we have content
+                    blocks[section].append(tuple(current[section]))
+                    current[section] = []
+
+        for section in self.sections:
+            if current[section]:
+                blocks[section].append(tuple(current[section]))
+
+        return {section: tuple(section_blocks) for section, section_blocks in blocks.items()}
+
+
+@lru_cache(maxsize=8)
+def _get_segmenter(boundary_keywords):
+    return SectionSegmenter(boundary_keywords)
+
+
+@lru_cache(maxsize=32)
+def segment_sections(text, boundary_keywords):
+    """Segment text once; repeated calls for the same resume reuse the result"""
+    return _get_segmenter(tuple(boundary_keywords)).segment(text)
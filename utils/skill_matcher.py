@@ -0,0 +1,86 @@
+import re
+from functools import lru_cache
+
+_WORD_CHAR = re.compile(r'\w')
+
+
+class SkillMatcher:
+    """Find every skill from a fixed list in a single scan over the text"""
+
+    def __init__(self, skills):
+        self.skills = list(skills)
+
+        # Several spellings of a skill can share one lowercased key
+        self.skills_by_key = {}
+        for skill in self.skills:
+            self.skills_by_key.setdefault(skill.lower(), []).append(skill)
+
+        keys = sorted((key for key in self.skills_by_key if key), key=len, reverse=True)
+        if keys:
+            # Longest keys first so "react native" wins over "react" at the same offset.
+            # The lookahead makes every match zero-width, so matches may overlap.
+            alternation = '|'.join(re.escape(key) for key in keys)
+            self.pattern = re.compile(rf'(?=(?<!\w)({alternation})(?!\w))', re.IGNORECASE)
+        else:
+            self.pattern = None
+
+        # A matched key also proves the shorter keys it contains (e.g. "react" in "react native")
+        self.implied = {key: self._contained_keys(key) for key in keys}
+
+    def _contained_keys(self, key):
+        """Collect the keys that occur inside another key on word boundaries"""
+        starts = [i for i in range(len(key)) if i == 0 or not _WORD_CHAR.match(key[i - 1])]
+        ends = [j for j in range(1, len(key) + 1) if j == len(key) or not _WORD_CHAR.match(key[j])]
+        return {
+            key[i:j]
+            for i in starts
+            for j in ends
+            if j > i and key[i:j] in self.skills_by_key
+        }
+
+    def find(self, text):
+        """Return the set of lowercased skill keys present in the text"""
+        found = set()
+        if self.pattern is None:
+            return found
+
+        for match in self.pattern.finditer(text):
+            key = match.group(1).lower()
+            if key not in found:
+                found |= self.implied.get(key, {key})
+        return found
+
+    def match(self, text):
+        """Return the found/missing split and match score for the text"""
+        found_keys = self.find(text)
+        found_skills = []
+        missing_skills = []
+
+        for skill in self.skills:
+            if skill.lower() in found_keys:
+                found_skills.append(skill)
+            else:
+                missing_skills.append(skill)
+
+        match_score = (len(found_skills) / len(self.skills)) * 100 if self.skills else 0
+
+        return {
+            'score': match_score,
+            'found_skills': found_skills,
+            'missing_skills': missing_skills
+        }
+
+
+@lru_cache(maxsize=256)
+def _build_skill_matcher(skills):
+    return SkillMatcher(skills)
+
+
+def get_skill_matcher(skills):
+    """Get a compiled matcher for a skill list, built once per distinct list"""
+    return _build_skill_matcher(tuple(skills))
+
+
+def skill_matcher_cache_info():
+    """Hit/miss statistics of the compiled matcher cache"""
+    return _build_skill_matcher.cache_info()